@@ -1,17 +1,233 @@
 """
 Adapters for feature engineering operations.
 """
+import math
 import pandas as pd
 import numpy as np
-from typing import List
+from numba import njit
+from typing import Sequence
 from src.domain.ports import IFeatureEngineer
 from src.domain.models import TimeSeriesData
 
+_NS_PER_HOUR = 3_600_000_000_000
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+
+# Cyclical encodings only take 12 (month) and 7 (weekday) distinct values;
+# tables indexed by month (1-12, slot 0 unused) and day_of_week (0-6) turn
+# per-row sin/cos into a gather with the same results
+_MONTHS = np.arange(13)
+_MONTH_SIN = np.sin(2 * np.pi * _MONTHS / 12)
+_MONTH_COS = np.cos(2 * np.pi * _MONTHS / 12)
+_WEEKDAYS = np.arange(7)
+_DAY_OF_WEEK_SIN = np.sin(2 * np.pi * _WEEKDAYS / 7)
+_DAY_OF_WEEK_COS = np.cos(2 * np.pi * _WEEKDAYS / 7)
+
+
+@njit(cache=True, nogil=True)
+def _rolling_stats(values, window, out_mean, out_std, out_min, out_max):
+    """
+    Compute rolling mean, std (ddof=1), min and max in a single pass.
+
+    Mean/variance are maintained with Welford add/remove updates; min/max use
+    monotonic deques of indices so every value is pushed and popped at most
+    once. NaNs are skipped, and a window only produces output once it holds
+    `window` valid observations (pandas' default min_periods).
+    """
+    n = values.shape[0]
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+
+    # Monotonic deques of indices: values increase along min_q, decrease along max_q
+    min_q = np.empty(n, dtype=np.int64)
+    max_q = np.empty(n, dtype=np.int64)
+    min_head = 0
+    min_tail = 0
+    max_head = 0
+    max_tail = 0
+
+    for i in range(n):
+        val = values[i]
+        if not math.isnan(val):
+            nobs += 1
+            delta = val - mean
+            mean += delta / nobs
+            ssqdm += ((nobs - 1) * delta * delta) / nobs
+
+            while min_tail > min_head and values[min_q[min_tail - 1]] >= val:
+                min_tail -= 1
+            min_q[min_tail] = i
+            min_tail += 1
+
+            while max_tail > max_head and values[max_q[max_tail - 1]] <= val:
+                max_tail -= 1
+            max_q[max_tail] = i
+            max_tail += 1
+
+        if i >= window:
+            old = values[i - window]
+            if not math.isnan(old):
+                nobs -= 1
+                if nobs > 0:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    ssqdm -= ((nobs + 1) * delta * delta) / nobs
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+
+            while min_tail > min_head and min_q[min_head] <= i - window:
+                min_head += 1
+            while max_tail > max_head and max_q[max_head] <= i - window:
+                max_head += 1
+
+        if nobs >= window:
+            out_mean[i] = mean
+            out_std[i] = math.sqrt(max(ssqdm, 0.0) / (nobs - 1)) if nobs > 1 else np.nan
+            out_min[i] = values[min_q[min_head]]
+            out_max[i] = values[max_q[max_head]]
+        else:
+            out_mean[i] = np.nan
+            out_std[i] = np.nan
+            out_min[i] = np.nan
+            out_max[i] = np.nan
+
+
+@njit(cache=True, nogil=True)
+def _rolling_stats_multi(values, windows, out):
+    """
+    Rolling statistics for several windows in one compiled call. out has
+    shape (len(windows), 4, n) and receives mean, std, min and max per window.
+    """
+    for k in range(windows.shape[0]):
+        _rolling_stats(values, windows[k], out[k, 0], out[k, 1], out[k, 2], out[k, 3])
+
+
+def _write_lags(values: np.ndarray, lags: Sequence[int], out: np.ndarray) -> None:
+    """Write values shifted by each lag into the rows of out, shape (len(lags), n)"""
+    n = len(values)
+    for row, lag in zip(out, lags):
+        # Lags beyond the series length are all-NaN either way
+        shift = min(max(int(lag), -n), n)
+        if shift > 0:
+            row[:shift] = np.nan
+            row[shift:] = values[:n - shift]
+        elif shift < 0:
+            row[:n + shift] = values[-shift:]
+            row[n + shift:] = np.nan
+        else:
+            row[:] = values
+
+
+def _write_rolling(values: np.ndarray, windows: Sequence[int], out: np.ndarray) -> None:
+    """
+    Write rolling mean, std, min and max per window into out, shape
+    (len(windows), 4, n), with one kernel launch for every window.
+    """
+    window_array = np.asarray(windows, dtype=np.int64)
+    if len(window_array) > 1:
+        _rolling_stats_multi(values, window_array, out)
+    elif len(window_array) == 1:
+        _rolling_stats(values, window_array[0], out[0, 0], out[0, 1], out[0, 2], out[0, 3])
+
+
+def _lag_columns(lags: Sequence[int]) -> list:
+    return [f'lag_{lag}' for lag in lags]
+
+
+def _rolling_columns(windows: Sequence[int]) -> list:
+    return [
+        f'rolling_{stat}_{window}'
+        for window in windows
+        for stat in ('mean', 'std', 'min', 'max')
+    ]
+
+
+# Output rows of _ohlcv_features, in column order
+_OHLCV_FEATURES = (
+    'price_range', 'price_range_pct', 'body', 'body_pct', 'upper_wick', 'lower_wick',
+    'close_position', 'vwap', 'typical_price', 'close_change', 'close_pct_change',
+    'volume_change', 'volume_pct_change', 'volume_price_trend', 'true_range', 'gap', 'gap_pct',
+)
+
+
+@njit(cache=True, nogil=True)
+def _nan_max(a, b):
+    """max() that skips a NaN operand, as pandas' row-wise max does"""
+    if math.isnan(a):
+        return b
+    if math.isnan(b):
+        return a
+    return max(a, b)
+
+
+@njit(cache=True, nogil=True)
+def _nan_min(a, b):
+    """min() that skips a NaN operand, as pandas' row-wise min does"""
+    if math.isnan(a):
+        return b
+    if math.isnan(b):
+        return a
+    return min(a, b)
+
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def _ohlcv_features(open_, high, low, close, volume, out):
+    """
+    Every OHLCV technical feature in one pass over the five columns.
+
+    out has shape (len(_OHLCV_FEATURES), n). Arithmetic follows the pandas
+    expressions it replaces operation for operation: row-wise max/min skip
+    NaN, pct changes are x / prev - 1 (inf on a zero previous value) and the
+    first row has no previous bar.
+    """
+    n = close.shape[0]
+    prev_close = np.nan
+    prev_volume = np.nan
+    for i in range(n):
+        o = open_[i]
+        h = high[i]
+        l = low[i]
+        c = close[i]
+        v = volume[i]
+
+        price_range = h - l
+        typical_price = (h + l + c) / 3
+        close_pct_change = c / prev_close - 1
+
+        out[0, i] = price_range
+        out[1, i] = price_range / c * 100
+        out[2, i] = c - o
+        out[3, i] = (c - o) / o * 100
+        out[4, i] = h - _nan_max(o, c)
+        out[5, i] = _nan_min(o, c) - l
+        # Default to middle if no range (NaN range included). Dividing by a
+        # safe denominator and selecting afterwards keeps this a blend rather
+        # than a branch; a multiply-by-mask would turn 0.5 into NaN for NaN close
+        has_range = price_range > 0
+        position = (c - l) / (price_range if has_range else 1.0)
+        out[6, i] = position if has_range else 0.5
+        out[7, i] = typical_price * v
+        out[8, i] = typical_price
+        out[9, i] = c - prev_close
+        out[10, i] = close_pct_change * 100
+        out[11, i] = v - prev_volume
+        out[12, i] = (v / prev_volume - 1) * 100
+        trend = close_pct_change * v
+        out[13, i] = 0.0 if math.isnan(trend) else trend
+        out[14, i] = _nan_max(_nan_max(price_range, abs(h - prev_close)), abs(l - prev_close))
+        out[15, i] = o - prev_close
+        out[16, i] = (o - prev_close) / prev_close * 100
+
+        prev_close = c
+        prev_volume = v
+
 
 class FeatureEngineer(IFeatureEngineer):
     """
-    Feature engineer using pandas for creating lag and rolling features.
-    Now supports OHLCV data structure.
+    Feature engineer working on the raw column arrays: lags by slice copies,
+    rolling statistics with a compiled single-pass kernel (one launch for
+    all windows). Now supports OHLCV data structure.
     """
     
     def __init__(self, price_column: str = 'close'):
@@ -25,7 +241,7 @@ class FeatureEngineer(IFeatureEngineer):
     def create_lag_features(
         self, 
         data: TimeSeriesData, 
-        lags: List[int]
+        lags: Sequence[int]
     ) -> pd.DataFrame:
         """
         Create lagged features from the specified price column.
@@ -37,24 +253,25 @@ class FeatureEngineer(IFeatureEngineer):
         Returns:
             DataFrame with lag features
         """
-        df = data.to_dataframe()
-        lag_features = pd.DataFrame(index=df.index)
-        
         # Create lag features for the configured price column
-        if self.price_column not in df.columns:
-            raise ValueError(f"Price column '{self.price_column}' not found in data")
+        price_values = self._price_values(data)
+        n = len(price_values)
         
-        price_values = df[self.price_column]
+        out = np.empty((len(lags), n), dtype=price_values.dtype)
+        _write_lags(price_values, lags, out)
         
-        for lag in lags:
-            lag_features[f'lag_{lag}'] = price_values.shift(lag)
-        
-        return lag_features
+        # Transposed, so every lag column stays contiguous in the frame
+        return pd.DataFrame(
+            out.T,
+            index=pd.RangeIndex(n),
+            columns=_lag_columns(lags),
+            copy=False
+        )
     
     def create_rolling_features(
         self, 
         data: TimeSeriesData, 
-        windows: List[int]
+        windows: Sequence[int]
     ) -> pd.DataFrame:
         """
         Create rolling window statistics features from the specified price column.
@@ -66,23 +283,68 @@ class FeatureEngineer(IFeatureEngineer):
         Returns:
             DataFrame with rolling features (mean, std, min, max)
         """
-        df = data.to_dataframe()
-        rolling_features = pd.DataFrame(index=df.index)
-        
         # Create rolling features for the configured price column
-        if self.price_column not in df.columns:
-            raise ValueError(f"Price column '{self.price_column}' not found in data")
+        price_values = self._price_values(data)
+        n = len(price_values)
+        
+        # One preallocated buffer; all four statistics of a window come out
+        # of a single pass
+        columns = _rolling_columns(windows)
+        out = np.empty((len(columns), n), dtype=price_values.dtype)
+        _write_rolling(price_values, windows, out.reshape(len(windows), 4, n))
         
-        price_values = df[self.price_column]
+        # Wrap the buffer as one 2-D block: on small series, building a frame
+        # column by column costs far more than the kernel itself
+        return pd.DataFrame(
+            out.T,
+            index=pd.RangeIndex(n),
+            columns=columns,
+            copy=False
+        )
+    
+    def create_features(
+        self, 
+        data: TimeSeriesData, 
+        lags: Sequence[int], 
+        windows: Sequence[int]
+    ) -> pd.DataFrame:
+        """
+        Create lag, rolling and time features in one call.
+        
+        Lag and rolling columns are written straight into a single
+        preallocated block, so no intermediate frames are built or joined.
+        
+        Args:
+            data: Time series data with OHLCV columns
+            lags: List of lag periods
+            windows: List of rolling window sizes
+            
+        Returns:
+            DataFrame with lag, rolling and time features
+        """
+        price_values = self._price_values(data)
+        n = len(price_values)
         
-        for window in windows:
-            rolling = price_values.rolling(window=window)
-            rolling_features[f'rolling_mean_{window}'] = rolling.mean()
-            rolling_features[f'rolling_std_{window}'] = rolling.std()
-            rolling_features[f'rolling_min_{window}'] = rolling.min()
-            rolling_features[f'rolling_max_{window}'] = rolling.max()
+        lag_columns = _lag_columns(lags)
+        columns = lag_columns + _rolling_columns(windows)
+        out = np.empty((len(columns), n), dtype=price_values.dtype)
+        _write_lags(price_values, lags, out[:len(lag_columns)])
+        _write_rolling(price_values, windows, out[len(lag_columns):].reshape(len(windows), 4, n))
         
-        return rolling_features
+        engineered = pd.DataFrame(
+            out.T,
+            index=pd.RangeIndex(n),
+            columns=columns,
+            copy=False
+        )
+        # Time features are integer-typed, so they stay a separate block
+        return pd.concat([engineered, self.create_time_features(data)], axis=1)
+    
+    def _price_values(self, data: TimeSeriesData) -> np.ndarray:
+        """Read the configured price column straight into an array of the series' dtype"""
+        if self.price_column not in ('open', 'high', 'low', 'close', 'volume'):
+            raise ValueError(f"Price column '{self.price_column}' not found in data")
+        return data.get_column_array(self.price_column)
     
     def create_time_features(self, data: TimeSeriesData) -> pd.DataFrame:
         """
@@ -94,26 +356,54 @@ class FeatureEngineer(IFeatureEngineer):
         Returns:
             DataFrame with time-based features
         """
-        df = data.to_dataframe()
-        time_features = pd.DataFrame(index=df.index)
-        
-        timestamps = pd.to_datetime(df['timestamp'])
-        
-        time_features['hour'] = timestamps.dt.hour
-        time_features['day_of_week'] = timestamps.dt.dayofweek
-        time_features['day_of_month'] = timestamps.dt.day
-        time_features['month'] = timestamps.dt.month
-        time_features['quarter'] = timestamps.dt.quarter
-        time_features['year'] = timestamps.dt.year
-        time_features['is_weekend'] = timestamps.dt.dayofweek.isin([5, 6]).astype(int)
-        
-        # Cyclical encoding for periodic features
-        time_features['month_sin'] = np.sin(2 * np.pi * timestamps.dt.month / 12)
-        time_features['month_cos'] = np.cos(2 * np.pi * timestamps.dt.month / 12)
-        time_features['day_of_week_sin'] = np.sin(2 * np.pi * timestamps.dt.dayofweek / 7)
-        time_features['day_of_week_cos'] = np.cos(2 * np.pi * timestamps.dt.dayofweek / 7)
-        
-        return time_features
+        timestamps = pd.DatetimeIndex(data.timestamps)
+        if timestamps.tz is not None:
+            # Use wall-clock time in the series' own timezone, as .dt would
+            timestamps = timestamps.tz_localize(None)
+        
+        # Derive every calendar field with integer arithmetic on epoch
+        # nanoseconds; only the month boundary needs a datetime64 cast
+        ns = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        nat = timestamps.isna()
+        has_nat = nat.any()
+        if has_nat:
+            # NaT is stored as INT64_MIN; compute on a placeholder and mask below
+            ns = np.where(nat, 0, ns)
+        days = ns // _NS_PER_DAY
+        month_starts = days.view('datetime64[D]').astype('datetime64[M]')
+        months = month_starts.view(np.int64)
+        
+        hour = (ns - days * _NS_PER_DAY) // _NS_PER_HOUR
+        day_of_week = (days + 3) % 7  # 1970-01-01 was a Thursday
+        day_of_month = days - month_starts.astype('datetime64[D]').view(np.int64) + 1
+        month = months % 12 + 1
+        year = months // 12 + 1970
+        
+        features = {
+            'hour': hour,
+            'day_of_week': day_of_week,
+            'day_of_month': day_of_month,
+            'month': month,
+            'quarter': (month - 1) // 3 + 1,
+            'year': year,
+            # Monday-Friday (0-4) floor to 0, Saturday/Sunday (5, 6) to 1
+            'is_weekend': day_of_week // 5,
+            # Cyclical encoding for periodic features
+            'month_sin': _MONTH_SIN.take(month),
+            'month_cos': _MONTH_COS.take(month),
+            'day_of_week_sin': _DAY_OF_WEEK_SIN.take(day_of_week),
+            'day_of_week_cos': _DAY_OF_WEEK_COS.take(day_of_week),
+        }
+        if has_nat:
+            # Match .dt on NaT: NaN fields (so float columns), not a weekend
+            for name, column in features.items():
+                if name == 'is_weekend':
+                    column[nat] = 0
+                else:
+                    column = features[name] = column.astype(np.float64, copy=False)
+                    column[nat] = np.nan
+        
+        return pd.DataFrame(features, index=pd.RangeIndex(len(ns)), copy=False)
     
     def create_ohlcv_features(self, data: TimeSeriesData) -> pd.DataFrame:
         """
@@ -125,54 +415,15 @@ class FeatureEngineer(IFeatureEngineer):
         Returns:
             DataFrame with OHLCV-derived technical indicators
         """
-        df = data.to_dataframe()
-        features = pd.DataFrame(index=df.index)
-        
-        # Price range features
-        features['price_range'] = df['high'] - df['low']
-        features['price_range_pct'] = (df['high'] - df['low']) / df['close'] * 100
-        
-        # Body and wick features (candlestick analysis)
-        features['body'] = df['close'] - df['open']
-        features['body_pct'] = (df['close'] - df['open']) / df['open'] * 100
-        features['upper_wick'] = df['high'] - df[['open', 'close']].max(axis=1)
-        features['lower_wick'] = df[['open', 'close']].min(axis=1) - df['low']
-        
-        # Price position within range (avoid division by zero)
-        price_range = df['high'] - df['low']
-        features['close_position'] = np.where(
-            price_range > 0,
-            (df['close'] - df['low']) / price_range,
-            0.5  # Default to middle if no range
-        )
-        
-        # Volume-weighted average price (VWAP)
-        features['vwap'] = (df['high'] + df['low'] + df['close']) / 3 * df['volume']
-        
-        # Typical price (used in many technical indicators)
-        features['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
-        
-        # Price momentum
-        features['close_change'] = df['close'].diff()
-        features['close_pct_change'] = df['close'].pct_change() * 100
+        columns = [data.get_column_array(col) for col in ['open', 'high', 'low', 'close', 'volume']]
+        n = len(columns[3])
         
-        # Volume features
-        features['volume_change'] = df['volume'].diff()
-        features['volume_pct_change'] = df['volume'].pct_change() * 100
+        # One fused pass writes every feature row; no intermediate Series
+        out = np.empty((len(_OHLCV_FEATURES), n), dtype=columns[3].dtype)
+        _ohlcv_features(*columns, out)
         
-        # Price-volume relationship
-        features['volume_price_trend'] = (df['close'].pct_change() * df['volume']).fillna(0)
-        
-        # True Range (used in ATR calculation)
-        prev_close = df['close'].shift(1)
-        features['true_range'] = pd.concat([
-            df['high'] - df['low'],
-            (df['high'] - prev_close).abs(),
-            (df['low'] - prev_close).abs()
-        ], axis=1).max(axis=1)
-        
-        # Gap detection
-        features['gap'] = df['open'] - prev_close
-        features['gap_pct'] = (df['open'] - prev_close) / prev_close * 100
-        
-        return features
\ No newline at end of file
+        return pd.DataFrame(
+            dict(zip(_OHLCV_FEATURES, out)),
+            index=pd.RangeIndex(n),
+            copy=False
+        )
@@ -2,14 +2,17 @@
 Kafka consumer - Input adapter for event-driven preprocessing.
 """
 import os
-import json
 import logging
 from typing import Optional
+import orjson
 from aiokafka import AIOKafkaConsumer
 from .message_handler import IngestionEventHandler
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; an explicit constructor argument takes precedence
+KAFKA_INPUT_TOPIC = os.getenv("KAFKA_INPUT_TOPIC", "data.ingestion.completed")
+
 
 class PreprocessingConsumer:
     """Kafka consumer that listens for ingestion completion events"""
@@ -18,23 +21,33 @@ class PreprocessingConsumer:
         self,
         bootstrap_servers: str,
         event_handler: IngestionEventHandler,
-        topic: str = 'data.ingestion.completed',
-        group_id: str = 'preprocessing-service-group'
+        topic: Optional[str] = None,
+        group_id: str = 'preprocessing-service-group',
+        max_batch_records: int = 500,
+        poll_timeout_ms: int = 500,
+        fetch_min_bytes: int = 1,
+        fetch_max_wait_ms: int = 200
     ):
         self.bootstrap_servers = bootstrap_servers
         self.event_handler = event_handler
-        self.topic = os.getenv("KAFKA_INPUT_TOPIC")
+        self.topic = topic or KAFKA_INPUT_TOPIC
         self.group_id = group_id
+        self.max_batch_records = max_batch_records
+        self.poll_timeout_ms = poll_timeout_ms
+        self.fetch_min_bytes = fetch_min_bytes
+        self.fetch_max_wait_ms = fetch_max_wait_ms
         self.consumer: Optional[AIOKafkaConsumer] = None
         self.is_running = False
     
     def _deserialize_message(self, message_bytes):
         """Safely deserialize JSON message"""
         try:
-            return json.loads(message_bytes.decode('utf-8'))
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            logger.error(f"Failed to deserialize message: {e}")
-            logger.error(f"Raw message: {message_bytes}")
+            # orjson parses the raw bytes directly, no decode step needed
+            return orjson.loads(message_bytes)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to deserialize message: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw message: %r", message_bytes)
             return None
     
     async def start(self):
@@ -45,36 +58,56 @@ class PreprocessingConsumer:
                 bootstrap_servers=self.bootstrap_servers,
                 group_id=self.group_id,
                 value_deserializer=self._deserialize_message,
+                fetch_min_bytes=self.fetch_min_bytes,
+                fetch_max_wait_ms=self.fetch_max_wait_ms,
                 auto_offset_reset='latest',  # Skip old bad messages
-                enable_auto_commit=True,
-                auto_commit_interval_ms=1000
+                enable_auto_commit=False  # Committed once per handled batch
             )
             
             await self.consumer.start()
             self.is_running = True
-            logger.info(f"Kafka consumer started on topic '{self.topic}'")
+            logger.info("Kafka consumer started on topic '%s'", self.topic)
             
-            async for message in self.consumer:
-                try:
-                    # Skip None values from deserialization errors
-                    if message.value is None:
-                        logger.warning("Skipping invalid message")
-                        continue
-                    
-                    await self.event_handler.handle(message.value)
-                except Exception as e:
-                    logger.error(f"Error handling message: {e}", exc_info=True)
-                    # Continue processing next messages
+            while self.is_running:
+                batches = await self.consumer.getmany(
+                    timeout_ms=self.poll_timeout_ms,
+                    max_records=self.max_batch_records
+                )
+                
+                if batches:
+                    await self._handle_batch(batches)
+                    await self.consumer.commit()
                     
         except Exception as e:
-            logger.error(f"Consumer error: {e}", exc_info=True)
+            logger.error("Consumer error: %s", e, exc_info=True)
             self.is_running = False
         finally:
             await self.stop()
     
+    async def _handle_batch(self, batches):
+        """Hand every record of one poll to the handler at once, logging instead of raising"""
+        events = []
+        for messages in batches.values():
+            for message in messages:
+                # Skip None values from deserialization errors
+                if message.value is None:
+                    logger.warning("Skipping invalid message")
+                    continue
+                events.append(message.value)
+        
+        if not events:
+            return
+        
+        try:
+            await self.event_handler.handle_batch(events)
+        except Exception as e:
+            logger.error("Error handling batch: %s", e, exc_info=True)
+            # Continue with the next poll
+    
     async def stop(self):
         """Stop the consumer gracefully"""
         if self.consumer:
-            await self.consumer.stop()
+            # Clear the flag first so the polling loop exits after this batch
             self.is_running = False
+            await self.consumer.stop()
             logger.info("Kafka consumer stopped")
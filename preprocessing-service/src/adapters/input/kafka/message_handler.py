@@ -1,8 +1,10 @@
 """
 Handles ingestion events and coordinates domain operations.
 """
+import asyncio
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from src.domain.service import PreprocessingService
 from src.domain.models import (
     PreprocessingConfig,
@@ -16,6 +18,19 @@ from shared import SimpleJobTracker
 
 logger = logging.getLogger(__name__)
 
+# Value -> member tables, built once instead of going through Enum(value) per event
+_INTERPOLATION_METHODS = {m.value: m for m in InterpolationMethod}
+_OUTLIER_METHODS = {m.value: m for m in OutlierMethod}
+_AGGREGATION_METHODS = {m.value: m for m in AggregationMethod}
+
+
+def _lookup_enum(table: Dict[str, Any], value: str, enum_name: str):
+    """Resolve an enum member by value, raising ValueError like Enum(value) does"""
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {enum_name}") from None
+
 
 class IngestionEventHandler:
     """Handles ingestion completion events and triggers preprocessing"""
@@ -35,77 +50,129 @@ class IngestionEventHandler:
         Args:
             event_data: Event payload containing series_id, job_id, and config
         """
-        series_id = None
-        job_id = None
+        await self.handle_batch([event_data])
+    
+    async def handle_batch(self, events: List[Dict[str, Any]]):
+        """
+        Process all ingestion events from one consumer poll.
         
-        try:
-            logger.info(f"Processing ingestion event: {event_data.get('series_id')}")
-            
+        Events are grouped by config, and each group is preprocessed with one
+        preprocess_batch call (a single raw-data query), run in a worker
+        thread so the event loop keeps serving other tasks. Events for the same
+        series and config share a run; every job still gets its own status
+        updates and completion or failure event.
+        
+        Args:
+            events: Event payloads in consumption order
+        """
+        # config key -> series_id -> job_ids, in consumption order
+        groups: Dict[Tuple, Dict[str, List[str]]] = {}
+        for event_data in events:
             series_id = event_data.get('series_id')
             job_id = event_data.get('job_id')
-            config_data = event_data.get('preprocessing_config', {})
             
-            if not series_id or not job_id:
-                raise ValueError("Missing required fields: series_id or job_id")
+            try:
+                logger.info("Processing ingestion event: %s", series_id)
+                
+                if not series_id or not job_id:
+                    raise ValueError("Missing required fields: series_id or job_id")
+                
+                # Mark preprocessing as started
+                SimpleJobTracker.update_status(
+                    job_id=job_id,
+                    series_id=series_id,
+                    status='running',
+                    stage='preprocessing'
+                )
+                
+                # Hashing the key here fails only this event if a value is unhashable
+                config_key = self._config_key(event_data.get('preprocessing_config', {}))
+                groups.setdefault(config_key, {}).setdefault(series_id, []).append(job_id)
+            except Exception as e:
+                await self._fail(series_id, job_id, e)
+        
+        for config_key, jobs in groups.items():
+            await self._handle_group(config_key, jobs)
+    
+    async def _handle_group(self, config_key: Tuple, jobs: Dict[str, List[str]]):
+        """Preprocess every series of one config group and report each job"""
+        try:
+            config = self._build_config_cached(*config_key)
             
-            # Mark preprocessing as started
-            SimpleJobTracker.update_status(
-                job_id=job_id,
-                series_id=series_id,
-                status='running',
-                stage='preprocessing'
+            # Execute preprocessing (domain logic) off the event loop
+            batch = await asyncio.to_thread(
+                self.preprocessing_service.preprocess_batch, list(jobs), config
             )
+        except Exception as e:
+            for series_id, job_ids in jobs.items():
+                for job_id in job_ids:
+                    await self._fail(series_id, job_id, e)
+            return
+        
+        for series_id, job_ids in jobs.items():
+            error = batch.errors.get(series_id)
+            if error is None:
+                try:
+                    result = batch.results[series_id]
+                    
+                    # Create features
+                    features_df = await asyncio.to_thread(
+                        self.preprocessing_service.create_features, series_id, config
+                    )
+                except Exception as e:
+                    error = e
             
-            # Build preprocessing configuration
-            config = self._build_config(config_data)
-            
-            # Execute preprocessing (domain logic)
-            result = self.preprocessing_service.preprocess(series_id, config)
-            
-            # Create features
-            features_df = self.preprocessing_service.create_features(series_id, config)
-
-            #  Mark preprocessing as completed
+            for job_id in job_ids:
+                if error is not None:
+                    await self._fail(series_id, job_id, error)
+                    continue
+                try:
+                    await self._complete(series_id, job_id, result, features_df)
+                except Exception as e:
+                    await self._fail(series_id, job_id, e)
+    
+    async def _complete(self, series_id: str, job_id: str, result, features_df):
+        """Mark a job completed and publish its success event"""
+        SimpleJobTracker.update_status(
+            job_id=job_id,
+            series_id=series_id,
+            status='completed',
+            stage='preprocessing',
+            metadata={
+                'data_points': len(result)
+            }
+        )
+        
+        # Publish success event
+        await self.event_publisher.publish_preprocessing_completed(
+            series_id=series_id,
+            job_id=job_id,
+            data_points=len(result.values),
+            features_created=list(features_df.columns),
+            metadata=result.metadata
+        )
+        
+        logger.info("Successfully preprocessed series %s for job %s", series_id, job_id)
+    
+    async def _fail(self, series_id: Optional[str], job_id: Optional[str], error: Exception):
+        """Log a failed event; mark its job failed and publish a failure event when identifiable"""
+        logger.error("Error processing ingestion event: %s", error, exc_info=error)
+        
+        if series_id and job_id:
+            # Mark preprocessing as failed
             SimpleJobTracker.update_status(
                 job_id=job_id,
                 series_id=series_id,
-                status='completed',
+                status='failed',
                 stage='preprocessing',
-                metadata={
-                    'data_points': len(result)
-                }
+                error_message=str(error)
             )
-            
-            # Publish success event
-            await self.event_publisher.publish_preprocessing_completed(
+            await self.event_publisher.publish_processing_failed(
                 series_id=series_id,
                 job_id=job_id,
-                data_points=len(result.values),
-                features_created=list(features_df.columns),
-                metadata=result.metadata
+                error=str(error),
+                stage='preprocessing'
             )
-            
-            logger.info(f"Successfully preprocessed series {series_id} for job {job_id}")
-            
-        except Exception as e:
-            logger.error(f"Error processing ingestion event: {e}", exc_info=True)
-            
-            # Publish failure event
-            if series_id and job_id:
-                # Mark preprocessing as failed
-                SimpleJobTracker.update_status(
-                    job_id=job_id,
-                    series_id=series_id,
-                    status='failed',
-                    stage='preprocessing',
-                    error_message=str(e)
-                )
-                await self.event_publisher.publish_processing_failed(
-                    series_id=series_id,
-                    job_id=job_id,
-                    error=str(e),
-                    stage='preprocessing'
-                )
     
     def _build_config(self, config_data: Dict[str, Any]) -> PreprocessingConfig:
         """
@@ -117,18 +184,53 @@ class IngestionEventHandler:
         Returns:
             PreprocessingConfig object
         """
+        return self._build_config_cached(*self._config_key(config_data))
+    
+    @staticmethod
+    def _config_key(config_data: Dict[str, Any]) -> Tuple:
+        """Hashable tuple of config values with defaults applied"""
+        lag_features = config_data.get('lag_features', [1, 7, 30])
+        rolling_window_sizes = config_data.get('rolling_window_sizes', [7, 30])
+        
+        # Lists are converted to tuples so the arguments are hashable
+        return (
+            config_data.get('interpolation_method', 'linear'),
+            config_data.get('outlier_method', 'iqr'),
+            config_data.get('outlier_threshold', 3.0),
+            config_data.get('resample_frequency'),
+            config_data.get('aggregation_method', 'mean'),
+            tuple(lag_features) if lag_features is not None else None,
+            tuple(rolling_window_sizes) if rolling_window_sizes is not None else None
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_config_cached(
+        interpolation_method: str,
+        outlier_method: str,
+        outlier_threshold: float,
+        resample_frequency: Optional[str],
+        aggregation_method: str,
+        lag_features: Optional[Tuple[int, ...]],
+        rolling_window_sizes: Optional[Tuple[int, ...]]
+    ) -> PreprocessingConfig:
+        """
+        Build (and validate) a PreprocessingConfig once per distinct config shape.
+        
+        Instances are shared between events, so callers must treat them as read-only.
+        """
         return PreprocessingConfig(
-            interpolation_method=InterpolationMethod(
-                config_data.get('interpolation_method', 'linear')
+            interpolation_method=_lookup_enum(
+                _INTERPOLATION_METHODS, interpolation_method, 'InterpolationMethod'
             ),
-            outlier_method=OutlierMethod(
-                config_data.get('outlier_method', 'iqr')
+            outlier_method=_lookup_enum(
+                _OUTLIER_METHODS, outlier_method, 'OutlierMethod'
             ),
-            outlier_threshold=config_data.get('outlier_threshold', 3.0),
-            resample_frequency=config_data.get('resample_frequency'),
-            aggregation_method=AggregationMethod(
-                config_data.get('aggregation_method', 'mean')
+            outlier_threshold=outlier_threshold,
+            resample_frequency=resample_frequency,
+            aggregation_method=_lookup_enum(
+                _AGGREGATION_METHODS, aggregation_method, 'AggregationMethod'
             ),
-            lag_features=config_data.get('lag_features', [1, 7, 30]),
-            rolling_window_sizes=config_data.get('rolling_window_sizes', [7, 30])
+            lag_features=list(lag_features) if lag_features is not None else None,
+            rolling_window_sizes=list(rolling_window_sizes) if rolling_window_sizes is not None else None
         )
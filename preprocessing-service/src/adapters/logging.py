@@ -24,11 +24,11 @@ class PythonLogger(ILogger):
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
     
-    def info(self, message: str):
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
     
     def error(self, message: str, exception: Exception = None):
         if exception:
@@ -36,8 +36,11 @@ class PythonLogger(ILogger):
         else:
             self.logger.error(message)
     
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
+    
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
 
 
 class ConsoleLogger(ILogger):
@@ -45,16 +48,16 @@ class ConsoleLogger(ILogger):
     Simple console logger for development/testing.
     """
     
-    def info(self, message: str):
-        print(f"[INFO] {message}")
+    def info(self, message: str, *args):
+        print(f"[INFO] {message % args if args else message}")
     
-    def warning(self, message: str):
-        print(f"[WARNING] {message}")
+    def warning(self, message: str, *args):
+        print(f"[WARNING] {message % args if args else message}")
     
     def error(self, message: str, exception: Exception = None):
         print(f"[ERROR] {message}")
         if exception:
             print(f"  Exception: {str(exception)}")
     
-    def debug(self, message: str):
-        print(f"[DEBUG] {message}")
\ No newline at end of file
+    def debug(self, message: str, *args):
+        print(f"[DEBUG] {message % args if args else message}")
\ No newline at end of file
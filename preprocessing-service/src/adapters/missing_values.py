@@ -1,14 +1,136 @@
 """
 Adapter for handling missing values in time series.
 """
-import pandas as pd
-from src.domain.models import TimeSeriesData, InterpolationMethod
+import math
+from dataclasses import replace
+from functools import partial
+import numpy as np
+from numba import njit
+from src.domain.models import TimeSeriesData, InterpolationMethod, FloatArray
 from src.domain.ports import IMissingValueHandler
 
+# Explicit signatures compile (or load from cache) the fill kernels at import,
+# so the first request does not pay JIT latency. Callers only ever pass
+# writable arrays: the handlers copy read-only buffers first.
+_INPLACE_SIGNATURES = ['void(float64[:])', 'void(float32[:])']
+
+
+@njit(_INPLACE_SIGNATURES, cache=True)
+def _interp_linear_inplace(values):
+    """
+    Linearly interpolate NaN runs in place, treating samples as evenly spaced.
+    Leading/trailing NaN runs are filled with the nearest valid value.
+    """
+    n = values.shape[0]
+    last = -1
+    for i in range(n):
+        if math.isnan(values[i]):
+            continue
+        if last == -1:
+            for k in range(i):
+                values[k] = values[i]
+        elif i - last > 1:
+            start = values[last]
+            delta = values[i] - start
+            span = i - last
+            for k in range(last + 1, i):
+                values[k] = start + delta * (k - last) / span
+        last = i
+    if last != -1:
+        for k in range(last + 1, n):
+            values[k] = values[last]
+
+
+@njit(_INPLACE_SIGNATURES, cache=True)
+def _ffill_inplace(values):
+    """Forward fill NaNs in place; a leading NaN run takes the first valid value."""
+    n = values.shape[0]
+    first = -1
+    current = np.nan
+    for i in range(n):
+        if math.isnan(values[i]):
+            values[i] = current
+        else:
+            current = values[i]
+            if first == -1:
+                first = i
+    for k in range(max(first, 0)):
+        values[k] = values[first]
+
+
+@njit(_INPLACE_SIGNATURES, cache=True)
+def _bfill_inplace(values):
+    """Backward fill NaNs in place; a trailing NaN run takes the last valid value."""
+    n = values.shape[0]
+    last = -1
+    current = np.nan
+    for i in range(n - 1, -1, -1):
+        if math.isnan(values[i]):
+            values[i] = current
+        else:
+            current = values[i]
+            if last == -1:
+                last = i
+    if last != -1:
+        for k in range(last + 1, n):
+            values[k] = values[last]
+
+
+def _fit_spline(x: FloatArray, y: FloatArray):
+    from scipy import interpolate
+    return interpolate.UnivariateSpline(x, y, k=3)
+
+
+def _fit_polynomial(x: FloatArray, y: FloatArray):
+    from scipy import interpolate
+    return interpolate.interp1d(x, y, kind=2, bounds_error=False, fill_value=np.nan)
+
+
+def _interp_scipy_inplace(values: FloatArray, fit):
+    """
+    Fill interior and trailing NaNs in place with a scipy spline/polynomial fit
+    over the sample positions, mirroring pandas' interpolate(method=...).
+    Leading NaNs are left for the edge fill.
+    """
+    valid = ~np.isnan(values)
+    x = np.flatnonzero(valid)
+    missing = np.flatnonzero(~valid)
+    missing = missing[missing > x[0]]
+    
+    terp = fit(x, values[valid])
+    values[missing] = terp(missing)
+
+
+def _fill_scipy_inplace(values: FloatArray, fit, order: int):
+    """Scipy fill plus edge fill; falls back to linear without order+1 valid values"""
+    valid_count = np.count_nonzero(~np.isnan(values))
+    if valid_count == len(values):
+        return
+    
+    if valid_count > order:
+        _interp_scipy_inplace(values, fit)
+        # Handle any remaining NaN values at the edges
+        _ffill_inplace(values)
+    else:
+        # Fallback to linear if not enough data
+        _interp_linear_inplace(values)
+
+
+# Strategy table: one in-place fill callable per method, resolved once per
+# series. The single-pass kernels also fill the edges themselves.
+_FILL_STRATEGIES = {
+    InterpolationMethod.LINEAR: _interp_linear_inplace,
+    InterpolationMethod.FORWARD_FILL: _ffill_inplace,
+    InterpolationMethod.BACKWARD_FILL: _bfill_inplace,
+    InterpolationMethod.SPLINE: partial(_fill_scipy_inplace, fit=_fit_spline, order=3),
+    InterpolationMethod.POLYNOMIAL: partial(_fill_scipy_inplace, fit=_fit_polynomial, order=2),
+}
+
 
 class MissingValueHandler(IMissingValueHandler):
     """
-    Implementation for handling missing values using pandas interpolation.
+    Implementation for handling missing values using single-pass fill kernels,
+    with scipy interpolation for spline/polynomial methods.
     Now supports OHLCV data structure.
     """
     
@@ -28,54 +150,46 @@ class MissingValueHandler(IMissingValueHandler):
         Returns:
             Time series data with missing values handled
         """
-        df = data.to_dataframe()
+        # Fill each OHLCV column as a raw float array, no DataFrame round-trip
+        fill = self._fill_strategy(method)
+        filled = {}
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            values = data.get_column_array(col).copy()
+            fill(values)
+            filled[col] = values
         
-        # Define OHLCV columns to interpolate
-        ohlcv_columns = ['open', 'high', 'low', 'close', 'volume']
-        
-        # Apply interpolation based on method
-        if method == InterpolationMethod.LINEAR:
-            for col in ohlcv_columns:
-                if col in df.columns:
-                    df[col] = df[col].interpolate(method='linear')
-                    
-        elif method == InterpolationMethod.FORWARD_FILL:
-            for col in ohlcv_columns:
-                if col in df.columns:
-                    df[col] = df[col].fillna(method='ffill')
-                    
-        elif method == InterpolationMethod.BACKWARD_FILL:
-            for col in ohlcv_columns:
-                if col in df.columns:
-                    df[col] = df[col].fillna(method='bfill')
-                    
-        elif method == InterpolationMethod.SPLINE:
-            for col in ohlcv_columns:
-                if col in df.columns:
-                    # Spline requires at least order+1 non-NaN values
-                    if df[col].notna().sum() > 3:
-                        df[col] = df[col].interpolate(method='spline', order=3)
-                    else:
-                        # Fallback to linear if not enough data
-                        df[col] = df[col].interpolate(method='linear')
-                        
-        elif method == InterpolationMethod.POLYNOMIAL:
-            for col in ohlcv_columns:
-                if col in df.columns:
-                    # Polynomial requires at least order+1 non-NaN values
-                    if df[col].notna().sum() > 2:
-                        df[col] = df[col].interpolate(method='polynomial', order=2)
-                    else:
-                        # Fallback to linear if not enough data
-                        df[col] = df[col].interpolate(method='linear')
-        
-        # Handle any remaining NaN values at the edges with forward/backward fill
-        for col in ohlcv_columns:
-            if col in df.columns:
-                df[col] = df[col].fillna(method='ffill').fillna(method='bfill')
+        # Timestamps, metadata and features are carried over unchanged
+        return replace(data, **filled)
+    
+    def handle_missing_inplace(
+        self, 
+        data: TimeSeriesData, 
+        method: InterpolationMethod
+    ) -> None:
+        """
+        Fill missing values straight into the series' column arrays.
         
-        # Preserve features if they exist
-        if 'features' not in df.columns and data.features is not None:
-            df['features'] = data.features
+        Columns are only copied when their buffer is read-only (e.g. a view
+        of a pandas frame); any other holder of the same arrays sees the fill.
         
-        return TimeSeriesData.from_dataframe(df, data.metadata)
\ No newline at end of file
+        Args:
+            data: Time series data to fill in place
+            method: Interpolation method to use
+        """
+        fill = self._fill_strategy(method)
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            values = data.get_column_array(col)
+            if not values.flags.writeable:
+                values = values.copy()
+                setattr(data, col, values)
+            fill(values)
+    
+    def _fill_strategy(self, method: InterpolationMethod):
+        """
+        Resolve the in-place fill callable for a method. Each fills NaNs in a
+        single column, including leading/trailing edges.
+        """
+        fill = _FILL_STRATEGIES.get(method)
+        if fill is None:
+            raise ValueError(f"Unknown interpolation method: {method}")
+        return fill
@@ -1,19 +1,147 @@
 """
 Adapters for outlier detection in time series.
 """
+import hashlib
+import math
+import threading
 import pandas as pd
 import numpy as np
-from typing import List
+from collections import OrderedDict
+from numba import njit
+from typing import List, Optional, Tuple
 from src.domain.ports import IOutlierDetector
 from src.domain.models import TimeSeriesData, OutlierMethod
 
 
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _linear_quantiles(values: np.ndarray, probs: List[float]) -> List[float]:
+    """
+    Linearly interpolated quantiles (pandas' default) via a single O(N)
+    np.partition on the bracketing ranks instead of a sort per quantile.
+    """
+    n = len(values)
+    if n == 0:
+        return [np.nan] * len(probs)
+    
+    positions = [p * (n - 1) for p in probs]
+    ranks = sorted({int(np.floor(pos)) for pos in positions} |
+                   {int(np.ceil(pos)) for pos in positions})
+    part = np.partition(values, ranks)
+    
+    quantiles = []
+    for pos in positions:
+        lower = part[int(np.floor(pos))]
+        upper = part[int(np.ceil(pos))]
+        quantiles.append(lower + (upper - lower) * (pos - np.floor(pos)))
+    return quantiles
+
+
+@njit(cache=True, nogil=True)
+def _zscore_limit(values, threshold):
+    """
+    One Welford pass for mean/variance (ddof=1) over the non-NaN values.
+    Returns the mean, the squared-deviation limit (threshold * std)**2 and
+    whether the z-score is defined (two or more valid values, std > 0).
+    No fastmath: it would let the compiler assume NaNs never occur.
+    """
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+    for i in range(values.shape[0]):
+        val = values[i]
+        if not math.isnan(val):
+            nobs += 1
+            delta = val - mean
+            mean += delta / nobs
+            ssqdm += delta * (val - mean)
+    
+    if nobs < 2:
+        return mean, 0.0, False
+    return mean, threshold * threshold * (ssqdm / (nobs - 1)), ssqdm > 0
+
+
+@njit(cache=True, nogil=True)
+def _zscore_mask(values, threshold, out):
+    """
+    Write (v - mean)**2 < (threshold * std)**2 into out. NaNs compare False;
+    with fewer than two valid values or std == 0 the limit is 0 and nothing
+    is kept.
+    """
+    mean, limit, _ = _zscore_limit(values, threshold)
+    for i in range(values.shape[0]):
+        deviation = values[i] - mean
+        out[i] = deviation * deviation < limit
+
+
+@njit(cache=True, nogil=True)
+def _zscore_outlier_mask(values, threshold, out):
+    """
+    Write (v - mean)**2 >= (threshold * std)**2 into out. Where the z-score
+    is undefined (fewer than two valid values, or std == 0) nothing is
+    flagged, as NaN z-scores never reach the threshold.
+    """
+    mean, limit, defined = _zscore_limit(values, threshold)
+    if not defined:
+        out[:] = False
+        return
+    
+    for i in range(values.shape[0]):
+        deviation = values[i] - mean
+        out[i] = deviation * deviation >= limit
+
+
+def _zscore_inliers(values: np.ndarray, threshold: float, cache_key=None) -> np.ndarray:
+    """|v - mean| / std < threshold over the non-NaN values (std with ddof=1)"""
+    mask = np.empty(len(values), dtype=np.bool_)
+    _zscore_mask(values, float(threshold), mask)
+    return mask
+
+
+def _zscore_outliers(values: np.ndarray, threshold: float) -> np.ndarray:
+    """|v - mean| / std >= threshold; NaNs and an undefined z-score flag nothing"""
+    mask = np.empty(len(values), dtype=np.bool_)
+    _zscore_outlier_mask(values, float(threshold), mask)
+    return mask
+
+
+def _iqr_inliers(values: np.ndarray, threshold: float, cache_key=None) -> np.ndarray:
+    """Values within [Q1 - threshold*IQR, Q3 + threshold*IQR]"""
+    valid = values[~np.isnan(values)]
+    Q1, Q3 = _linear_quantiles(valid, [0.25, 0.75])
+    IQR = Q3 - Q1
+    lower_bound = Q1 - threshold * IQR
+    upper_bound = Q3 + threshold * IQR
+    # One comparison against the band's centre instead of two bounds
+    center = 0.5 * (lower_bound + upper_bound)
+    half_width = 0.5 * (upper_bound - lower_bound)
+    return np.abs(values - center) <= half_width
+
+
 class StatisticalOutlierDetector(IOutlierDetector):
     """
     Outlier detector using statistical methods (Z-score, IQR, Isolation Forest).
     Now supports OHLCV data structure.
     """
     
+    def __init__(self, iforest_cache_size: int = 32):
+        """
+        Args:
+            iforest_cache_size: Maximum number of fitted isolation forests kept,
+                                one per series, price column and data fingerprint
+        """
+        self.iforest_cache_size = iforest_cache_size
+        self._iforest_cache: OrderedDict = OrderedDict()
+        # Detection runs on concurrent API worker threads
+        self._iforest_lock = threading.Lock()
+        # Strategy table, resolved once per call instead of an if/elif chain
+        self._inlier_strategies = {
+            OutlierMethod.ZSCORE: _zscore_inliers,
+            OutlierMethod.IQR: _iqr_inliers,
+            OutlierMethod.ISOLATION_FOREST: self._isolation_forest_inliers,
+        }
+    
     def detect_and_remove(
         self, 
         data: TimeSeriesData, 
@@ -33,54 +161,55 @@ class StatisticalOutlierDetector(IOutlierDetector):
         Returns:
             Time series data with outliers removed
         """
-        df = data.to_dataframe()
-        
-        # Validate price column exists
-        if price_column not in df.columns:
-            raise ValueError(f"Price column '{price_column}' not found in data")
+        # Keep only inliers straight from the column arrays (features included)
+        mask = self._price_inlier_mask(data, method, threshold, price_column)
+        return data.take(np.flatnonzero(mask))
+    
+    def detect_and_remove_inplace(
+        self, 
+        data: TimeSeriesData, 
+        method: OutlierMethod, 
+        threshold: float,
+        price_column: str = 'close'
+    ) -> None:
+        """
+        Detect outliers and drop their rows from `data` itself.
         
-        price_values = df[price_column]
+        Each column is rebound to its inlier rows; when nothing is removed the
+        columns are left untouched and no arrays are allocated.
         
-        # Detect outliers based on method
-        if method == OutlierMethod.ZSCORE:
-            z_scores = np.abs(
-                (price_values - price_values.mean()) / price_values.std()
-            )
-            mask = z_scores < threshold
-            df = df[mask]
-        
-        elif method == OutlierMethod.IQR:
-            Q1 = price_values.quantile(0.25)
-            Q3 = price_values.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            df = df[
-                (price_values >= lower_bound) & 
-                (price_values <= upper_bound)
-            ]
-        
-        elif method == OutlierMethod.ISOLATION_FOREST:
-            from sklearn.ensemble import IsolationForest
-            
-            # Reshape for sklearn
-            values = price_values.values.reshape(-1, 1)
-            
-            # Train isolation forest
-            iso_forest = IsolationForest(
-                contamination=0.1,
-                random_state=42
-            )
-            predictions = iso_forest.fit_predict(values)
-            
-            # Keep only inliers (prediction == 1)
-            df = df[predictions == 1]
+        Args:
+            data: Time series data with OHLCV columns
+            method: Method for outlier detection
+            threshold: Threshold for outlier detection (used by ZSCORE and IQR)
+            price_column: Which price column to use for outlier detection
+        """
+        mask = self._price_inlier_mask(data, method, threshold, price_column)
+        if mask.all():
+            return
         
-        else:
-            raise ValueError(f"Unknown outlier detection method: {method}")
+        positions = np.flatnonzero(mask)
+        data.timestamps = data.timestamps[positions]
+        for col in _PRICE_COLUMNS:
+            setattr(data, col, getattr(data, col)[positions])
+        if data.features is not None:
+            data.features = [data.features[i] for i in positions]
+    
+    def _price_inlier_mask(
+        self, 
+        data: TimeSeriesData, 
+        method: OutlierMethod, 
+        threshold: float,
+        price_column: str
+    ) -> np.ndarray:
+        """Validate the price column and compute its inlier mask"""
+        if price_column not in _PRICE_COLUMNS:
+            raise ValueError(f"Price column '{price_column}' not found in data")
         
-        # Preserve features if they exist in the filtered data
-        return TimeSeriesData.from_dataframe(df, data.metadata)
+        price_values = data.get_column_array(price_column)
+        return self._inlier_mask(
+            price_values, method, threshold, self._cache_key(data, method, price_column)
+        )
     
     def detect_only(
         self, 
@@ -88,7 +217,7 @@ class StatisticalOutlierDetector(IOutlierDetector):
         method: OutlierMethod, 
         threshold: float,
         price_column: str = 'close'
-    ) -> List[int]:
+    ) -> np.ndarray:
         """
         Detect outlier indices without removing them.
         
@@ -99,40 +228,127 @@ class StatisticalOutlierDetector(IOutlierDetector):
             price_column: Which price column to use for outlier detection
             
         Returns:
-            List of indices where outliers were detected
+            Integer array of positions where outliers were detected
         """
-        df = data.to_dataframe()
-        
         # Validate price column exists
-        if price_column not in df.columns:
+        if price_column not in _PRICE_COLUMNS:
             raise ValueError(f"Price column '{price_column}' not found in data")
         
-        price_values = df[price_column]
-        outlier_mask = np.zeros(len(df), dtype=bool)
+        price_values = data.get_column_array(price_column)
         
         if method == OutlierMethod.ZSCORE:
-            z_scores = np.abs(
-                (price_values - price_values.mean()) / price_values.std()
-            )
-            outlier_mask = z_scores >= threshold
-        
-        elif method == OutlierMethod.IQR:
-            Q1 = price_values.quantile(0.25)
-            Q3 = price_values.quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            outlier_mask = (price_values < lower_bound) | (price_values > upper_bound)
-        
-        elif method == OutlierMethod.ISOLATION_FOREST:
-            from sklearn.ensemble import IsolationForest
-            
-            values = price_values.values.reshape(-1, 1)
-            iso_forest = IsolationForest(contamination=0.1, random_state=42)
-            predictions = iso_forest.fit_predict(values)
-            outlier_mask = predictions == -1
+            # Not ~inliers: a flat or near-empty series keeps no inliers, yet
+            # its undefined z-scores flag no outliers either
+            return np.flatnonzero(_zscore_outliers(price_values, threshold))
+        
+        # Missing values are neither inliers nor reported as outliers
+        inlier_mask = self._inlier_mask(
+            price_values, method, threshold, self._cache_key(data, method, price_column)
+        )
+        outlier_mask = ~inlier_mask & ~np.isnan(price_values)
+        
+        return np.flatnonzero(outlier_mask)
+    
+    def _inlier_mask(
+        self, 
+        values: np.ndarray, 
+        method: OutlierMethod, 
+        threshold: float,
+        cache_key: Optional[Tuple[str, str]] = None
+    ) -> np.ndarray:
+        """
+        Build a boolean mask of inliers for the given method.
         
-        else:
+        Args:
+            values: Price values as a float array (NaN marks missing)
+            method: Method for outlier detection
+            threshold: Threshold for outlier detection (used by ZSCORE and IQR)
+            cache_key: Key for reusing a fitted isolation forest, None to always refit
+            
+        Returns:
+            Boolean array, True where the value is kept; NaN values are False
+        """
+        strategy = self._inlier_strategies.get(method)
+        if strategy is None:
             raise ValueError(f"Unknown outlier detection method: {method}")
+        return strategy(values, threshold, cache_key)
+    
+    def _isolation_forest_inliers(
+        self, 
+        values: np.ndarray, 
+        threshold: float,
+        cache_key: Optional[Tuple[str, str]]
+    ) -> np.ndarray:
+        """Inliers as predicted by a (cached) isolation forest; threshold is unused"""
+        # sklearn expects a 2D array
+        samples = values.reshape(-1, 1)
+        predictions = self._get_isolation_forest(samples, cache_key).predict(samples)
+        
+        # Inliers are predicted as 1
+        return predictions == 1
+    
+    def _cache_key(
+        self, 
+        data: TimeSeriesData, 
+        method: OutlierMethod, 
+        price_column: str
+    ) -> Optional[Tuple]:
+        """
+        Isolation forests are only reused for data that identifies its series,
+        and only while that data is unchanged: the key carries the length,
+        first/last timestamp and a hash of the price column.
+        """
+        if method != OutlierMethod.ISOLATION_FOREST:
+            return None
+        series_id = data.metadata.get('series_id') if data.metadata else None
+        if series_id is None:
+            return None
+        
+        values = np.ascontiguousarray(data.get_column_array(price_column))
+        timestamps = data.timestamps
+        n = len(values)
+        return (
+            series_id,
+            price_column,
+            n,
+            timestamps[0] if n else None,
+            timestamps[-1] if n else None,
+            hashlib.blake2b(values, digest_size=16).digest(),
+        )
+    
+    def _get_isolation_forest(self, samples: np.ndarray, cache_key: Optional[Tuple[str, str]]):
+        """
+        Return a fitted isolation forest, training one only on a cache miss.
+        
+        Args:
+            samples: 2D array of values to fit on if no model is cached
+            cache_key: Cache key, or None to always fit a fresh model
+            
+        Returns:
+            Fitted IsolationForest
+        """
+        from sklearn.ensemble import IsolationForest
+        
+        if cache_key is not None:
+            with self._iforest_lock:
+                cached = self._iforest_cache.get(cache_key)
+                if cached is not None:
+                    self._iforest_cache.move_to_end(cache_key)
+                    return cached
+        
+        # Fit outside the lock; a concurrent miss on the same key just refits
+        iso_forest = IsolationForest(
+            contamination=0.1,
+            random_state=42,
+            n_jobs=-1
+        ).fit(samples)
+        
+        if cache_key is not None:
+            with self._iforest_lock:
+                self._iforest_cache[cache_key] = iso_forest
+                self._iforest_cache.move_to_end(cache_key)
+                # Evict the least recently used model
+                if len(self._iforest_cache) > self.iforest_cache_size:
+                    self._iforest_cache.popitem(last=False)
         
-        return np.where(outlier_mask)[0].tolist()
\ No newline at end of file
+        return iso_forest
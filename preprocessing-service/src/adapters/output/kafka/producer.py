@@ -2,15 +2,31 @@
 Kafka producer - Output adapter for publishing events.
 """
 import os
-import json
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+import orjson
 from aiokafka import AIOKafkaProducer
 from src.domain.ports import IEventPublisher
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; explicit constructor arguments take precedence
+KAFKA_OUTPUT_TOPIC = os.getenv("KAFKA_OUTPUT_TOPIC", "data.preprocessing.completed")
+KAFKA_ERR_TOPIC = os.getenv("KAFKA_ERR_TOPIC", "data.processing.failed")
+
+
+def _serialize_event(event: Dict[str, Any]) -> bytes:
+    """Serialize an event to JSON bytes; datetimes are emitted as ISO 8601"""
+    return orjson.dumps(event, default=str)
+
+
+def _log_delivery_failure(future: asyncio.Future):
+    """Done-callback for a send's delivery future; only failures are logged"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Kafka delivery failed: %s", future.exception())
+
 
 class KafkaEventPublisher(IEventPublisher):
     """Kafka implementation of event publisher port"""
@@ -18,12 +34,18 @@ class KafkaEventPublisher(IEventPublisher):
     def __init__(
         self,
         bootstrap_servers: str,
-        completed_topic: str = 'data.preprocessing.completed',
-        failed_topic: str = 'data.processing.failed'
+        completed_topic: Optional[str] = None,
+        failed_topic: Optional[str] = None,
+        linger_ms: int = 10,
+        max_batch_size: int = 65536,
+        compression_type: str = 'lz4'
     ):
         self.bootstrap_servers = bootstrap_servers
-        self.completed_topic = os.getenv("KAFKA_OUTPUT_TOPIC", completed_topic)
-        self.failed_topic = os.getenv("KAFKA_ERR_TOPIC", failed_topic)
+        self.completed_topic = completed_topic or KAFKA_OUTPUT_TOPIC
+        self.failed_topic = failed_topic or KAFKA_ERR_TOPIC
+        self.linger_ms = linger_ms
+        self.max_batch_size = max_batch_size
+        self.compression_type = compression_type
         self.producer: Optional[AIOKafkaProducer] = None
     
     async def _get_producer(self) -> AIOKafkaProducer:
@@ -31,14 +53,29 @@ class KafkaEventPublisher(IEventPublisher):
         if self.producer is None:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=self.bootstrap_servers,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
-                compression_type='gzip',
-                max_request_size=1048576  # 1MB
+                value_serializer=_serialize_event,
+                # lz4 is far cheaper on CPU than gzip for small JSON payloads
+                compression_type=self.compression_type,
+                max_request_size=1048576,  # 1MB
+                # Coalesce sends into fewer broker requests; send() only awaits
+                # enqueueing, so the linger does not block publishers
+                linger_ms=self.linger_ms,
+                max_batch_size=self.max_batch_size,
+                acks=1
             )
             await self.producer.start()
-            logger.info(f"Kafka producer started: {self.bootstrap_servers}")
+            logger.info("Kafka producer started: %s", self.bootstrap_servers)
         return self.producer
     
+    async def _enqueue(self, topic: str, event: Dict[str, Any]):
+        """
+        Append an event to the producer's batch and return without waiting for
+        the broker; delivery errors surface through the logged callback.
+        """
+        producer = await self._get_producer()
+        delivery = await producer.send(topic, value=event)
+        delivery.add_done_callback(_log_delivery_failure)
+    
     async def publish_preprocessing_completed(
         self,
         series_id: str,
@@ -50,7 +87,7 @@ class KafkaEventPublisher(IEventPublisher):
         """Publish preprocessing completion event"""
         event = {
             'event_type': 'preprocessing.completed',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'series_id': series_id,
             'job_id': job_id,
             'data_points': data_points,
@@ -59,14 +96,14 @@ class KafkaEventPublisher(IEventPublisher):
         }
         
         try:
-            producer = await self._get_producer()
-            await producer.send(self.completed_topic, value=event)
+            await self._enqueue(self.completed_topic, event)
             logger.info(
-                f"Published preprocessing completed event - "
-                f"Job: {job_id}, Series: {series_id}, Points: {data_points}"
+                "Published preprocessing completed event - "
+                "Job: %s, Series: %s, Points: %s",
+                job_id, series_id, data_points
             )
         except Exception as e:
-            logger.error(f"Failed to publish completion event: {e}", exc_info=True)
+            logger.error("Failed to publish completion event: %s", e, exc_info=True)
             raise
     
     async def publish_processing_failed(
@@ -79,7 +116,7 @@ class KafkaEventPublisher(IEventPublisher):
         """Publish processing failure event"""
         event = {
             'event_type': 'processing.failed',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'series_id': series_id,
             'job_id': job_id,
             'stage': stage,
@@ -87,17 +124,19 @@ class KafkaEventPublisher(IEventPublisher):
         }
         
         try:
-            producer = await self._get_producer()
-            await producer.send(self.failed_topic, value=event)
+            await self._enqueue(self.failed_topic, event)
             logger.error(
-                f"Published processing failed event - "
-                f"Job: {job_id}, Series: {series_id}, Stage: {stage}, Error: {error}"
+                "Published processing failed event - "
+                "Job: %s, Series: %s, Stage: %s, Error: %s",
+                job_id, series_id, stage, error
             )
         except Exception as e:
-            logger.error(f"Failed to publish failure event: {e}", exc_info=True)
+            logger.error("Failed to publish failure event: %s", e, exc_info=True)
     
     async def close(self):
-        """Close producer connection"""
+        """Deliver any batched events, then close the producer connection"""
         if self.producer:
+            await self.producer.flush()
             await self.producer.stop()
+            self.producer = None
             logger.info("Kafka producer closed")
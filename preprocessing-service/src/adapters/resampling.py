@@ -1,12 +1,58 @@
 """
 Adapter for resampling time series data.
 """
+import numpy as np
 import pandas as pd
+from numba import njit
 
 from src.domain.models import TimeSeriesData, AggregationMethod
 from src.domain.ports import IResampler
 
 
+_OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+_AGGREGATION_FUNCS = {
+    AggregationMethod.MEAN: 'mean',
+    AggregationMethod.SUM: 'sum',
+    AggregationMethod.MIN: 'min',
+    AggregationMethod.MAX: 'max',
+    AggregationMethod.MEDIAN: 'median'
+}
+
+
+@njit(cache=True)
+def _aggregate_ohlcv(open_, high, low, close, volume, bucket_sizes):
+    """
+    Fused OHLCV reduction over time-sorted rows split into consecutive buckets:
+    first open, max high, min low, last close and summed volume, skipping NaN
+    like the pandas aggregations. Returns a (5, n_buckets) array in the input
+    dtype and a mask of buckets whose open, high, low and close are all present.
+    """
+    n_buckets = bucket_sizes.shape[0]
+    out = np.empty((5, n_buckets), dtype=open_.dtype)
+    out[:] = np.nan
+    keep = np.empty(n_buckets, dtype=np.bool_)
+    start = 0
+    for b in range(n_buckets):
+        stop = start + bucket_sizes[b]
+        vol = 0.0
+        for i in range(start, stop):
+            if np.isnan(out[0, b]) and not np.isnan(open_[i]):
+                out[0, b] = open_[i]
+            if not np.isnan(high[i]) and not high[i] <= out[1, b]:
+                out[1, b] = high[i]
+            if not np.isnan(low[i]) and not low[i] >= out[2, b]:
+                out[2, b] = low[i]
+            if not np.isnan(close[i]):
+                out[3, b] = close[i]
+            if not np.isnan(volume[i]):
+                vol += volume[i]
+        out[4, b] = vol
+        keep[b] = not (np.isnan(out[0, b]) or np.isnan(out[1, b])
+                       or np.isnan(out[2, b]) or np.isnan(out[3, b]))
+        start = stop
+    return out, keep
+
+
 class Resampler(IResampler):
     """
     Implementation for resampling time series data to different frequencies.
@@ -37,31 +83,37 @@ class Resampler(IResampler):
         Returns:
             Resampled time series data
         """
-        df = data.to_dataframe()
-        df.set_index('timestamp', inplace=True)
-        
-        # Define proper OHLCV aggregation rules
-        ohlcv_agg = {
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        }
-        
-        # Apply OHLCV aggregation
-        resampled = df[['open', 'high', 'low', 'close', 'volume']].resample(frequency).agg(ohlcv_agg)
+        timestamps = data.timestamps
+        columns = [data.get_column_array(col) for col in _OHLCV_COLUMNS]
+        if not timestamps.is_monotonic_increasing:
+            order = np.argsort(timestamps.asi8, kind='stable')
+            timestamps = timestamps[order]
+            columns = [col[order] for col in columns]
         
-        # Drop rows with NaN (periods with no data)
-        resampled = resampled.dropna()
+        # Bucket labels and sizes come from pandas' calendar-aware binning;
+        # counting is the only per-row work left to pandas
+        bucket_sizes = pd.Series(
+            np.empty(len(timestamps), dtype=np.int8), index=timestamps
+        ).resample(frequency).size()
         
-        # Reset index to get timestamp back as a column
-        resampled.reset_index(inplace=True)
+        # Single fused pass over the sorted rows for all five OHLCV reductions
+        # Periods with no data (or no price in some OHLC column) are dropped
+        # through the kernel's mask rather than a dropna() copy
+        aggregated, keep = _aggregate_ohlcv(*columns, bucket_sizes.to_numpy(dtype=np.int64))
         
         # Note: features are typically dropped during resampling as they may not be meaningful
         # If you need to preserve features, you'd need to define custom aggregation logic
         
-        return TimeSeriesData.from_dataframe(resampled, data.metadata)
+        return TimeSeriesData(
+            timestamps=bucket_sizes.index[keep],
+            open=aggregated[0, keep],
+            high=aggregated[1, keep],
+            low=aggregated[2, keep],
+            close=aggregated[3, keep],
+            volume=aggregated[4, keep],
+            metadata=data.metadata,
+            dtype=data.dtype
+        )
     
     def _get_aggregation_func(self, method: AggregationMethod):
         """
@@ -73,11 +125,4 @@ class Resampler(IResampler):
         Returns:
             String name of pandas aggregation function
         """
-        mapping = {
-            AggregationMethod.MEAN: 'mean',
-            AggregationMethod.SUM: 'sum',
-            AggregationMethod.MIN: 'min',
-            AggregationMethod.MAX: 'max',
-            AggregationMethod.MEDIAN: 'median'
-        }
-        return mapping.get(method, 'mean')
\ No newline at end of file
+        return _AGGREGATION_FUNCS.get(method, 'mean')
\ No newline at end of file
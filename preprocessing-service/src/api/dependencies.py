@@ -3,6 +3,7 @@ Dependency injection container for the API.
 Configures and provides all service dependencies.
 """
 import os
+from functools import lru_cache
 from src.domain.service import PreprocessingService
 from src.adapters.repository import TimescaleDBRepository
 from src.adapters.missing_values import MissingValueHandler
@@ -51,13 +52,7 @@ def get_preprocessing_service() -> PreprocessingService:
     )
 
 
-# Singleton instance for the application
-_service_instance = None
-
-
+@lru_cache(maxsize=None)
 def get_service() -> PreprocessingService:
     """Get or create singleton service instance"""
-    global _service_instance
-    if _service_instance is None:
-        _service_instance = get_preprocessing_service()
-    return _service_instance
+    return get_preprocessing_service()
@@ -13,6 +13,7 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.append(project_root)
 
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.schemas import (
@@ -119,6 +120,8 @@ async def preprocess_series(
 ):
     """
     Preprocess time series data (synchronous REST endpoint).
+    The blocking pipeline runs in the threadpool so the event loop (and the
+    Kafka consumer sharing it) keeps serving.
     """
     try:
         config = PreprocessingConfig(
@@ -129,7 +132,7 @@ async def preprocess_series(
             aggregation_method=AggregationMethod(request.aggregation_method)
         )
         
-        result = service.preprocess(request.series_id, config)
+        result = await run_in_threadpool(service.preprocess, request.series_id, config)
         
         return PreprocessResponse(
             status="success",
@@ -158,7 +161,7 @@ async def create_features(
             rolling_window_sizes=request.rolling_window_sizes
         )
         
-        features_df = service.create_features(request.series_id, config)
+        features_df = await run_in_threadpool(service.create_features, request.series_id, config)
         
         return FeatureResponse(
             status="success",
@@ -182,7 +185,7 @@ async def validate_series(
     Validate time series data quality.
     """
     try:
-        validation = service.validate_data(series_id)
+        validation = await run_in_threadpool(service.validate_data, series_id)
         return ValidationResponse(**validation)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,7 +1,7 @@
 """
 Pydantic schemas for API request/response validation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 
 
@@ -14,17 +14,16 @@ class PreprocessRequest(BaseModel):
     resample_frequency: Optional[str] = Field(None, description="Frequency for resampling (e.g., 'D', 'H')")
     aggregation_method: str = Field(default="mean", description="Aggregation method for resampling")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "series_id": "sensor_123",
-                "interpolation_method": "linear",
-                "outlier_method": "zscore",
-                "outlier_threshold": 3.0,
-                "resample_frequency": "D",
-                "aggregation_method": "mean"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "series_id": "sensor_123",
+            "interpolation_method": "linear",
+            "outlier_method": "zscore",
+            "outlier_threshold": 3.0,
+            "resample_frequency": "D",
+            "aggregation_method": "mean"
         }
+    })
 
 
 class FeatureRequest(BaseModel):
@@ -33,15 +32,14 @@ class FeatureRequest(BaseModel):
     lag_features: Optional[List[int]] = Field(None, description="List of lag values")
     rolling_window_sizes: Optional[List[int]] = Field(None, description="List of rolling window sizes")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "series_id": "sensor_123",
-                "lag_features": [1, 7, 30],
-                "rolling_window_sizes": [7, 14, 30]
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "series_id": "sensor_123",
+            "lag_features": [1, 7, 30],
+            "rolling_window_sizes": [7, 14, 30]
         }
-        
+    })
+
 
 class PreprocessResponse(BaseModel):
     """Response schema for preprocessing endpoint"""
@@ -3,12 +3,15 @@ Dependency injection container for wiring adapters and services.
 """
 import os
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
 
-from src.domain.service import PreprocessingService
-from src.domain.ports import IEventPublisher
-from src.adapters.output.kafka import KafkaEventPublisher
-from src.adapters.input.kafka import PreprocessingConsumer, IngestionEventHandler
+# Adapters (aiokafka, the job tracker, the numeric stack) are imported by the
+# getters that build them, so importing the container stays cheap
+if TYPE_CHECKING:
+    from src.domain.service import PreprocessingService
+    from src.domain.ports import IEventPublisher
+    from src.adapters.input.kafka import PreprocessingConsumer
 
 logger = logging.getLogger(__name__)
 
@@ -17,19 +20,20 @@ class ApplicationContainer:
     """Container managing application dependencies"""
     
     def __init__(self):
-        self._event_publisher: Optional[IEventPublisher] = None
-        self._preprocessing_service: Optional[PreprocessingService] = None
-        self._kafka_consumer: Optional[PreprocessingConsumer] = None
+        self._event_publisher: Optional['IEventPublisher'] = None
+        self._preprocessing_service: Optional['PreprocessingService'] = None
+        self._kafka_consumer: Optional['PreprocessingConsumer'] = None
         self._bootstrap_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka:9092")
     
-    def get_event_publisher(self) -> IEventPublisher:
+    def get_event_publisher(self) -> 'IEventPublisher':
         """Get or create Kafka event publisher"""
         if self._event_publisher is None:
+            from src.adapters.output.kafka import KafkaEventPublisher
             self._event_publisher = KafkaEventPublisher(self._bootstrap_servers)
             logger.info("Kafka event publisher initialized")
         return self._event_publisher
     
-    def get_preprocessing_service(self) -> PreprocessingService:
+    def get_preprocessing_service(self) -> 'PreprocessingService':
         """Get or create preprocessing service"""
         if self._preprocessing_service is None:
             # Import here to avoid circular dependencies
@@ -38,9 +42,10 @@ class ApplicationContainer:
             logger.info("Preprocessing service initialized")
         return self._preprocessing_service
     
-    def get_kafka_consumer(self) -> PreprocessingConsumer:
+    def get_kafka_consumer(self) -> 'PreprocessingConsumer':
         """Get or create Kafka consumer with wired dependencies"""
         if self._kafka_consumer is None:
+            from src.adapters.input.kafka import PreprocessingConsumer, IngestionEventHandler
             service = self.get_preprocessing_service()
             publisher = self.get_event_publisher()
             
@@ -62,13 +67,7 @@ class ApplicationContainer:
         logger.info("Application container shut down")
 
 
-# Singleton instance
-_container: Optional[ApplicationContainer] = None
-
-
+@lru_cache(maxsize=None)
 def get_container() -> ApplicationContainer:
     """Get the application container singleton"""
-    global _container
-    if _container is None:
-        _container = ApplicationContainer()
-    return _container
+    return ApplicationContainer()
@@ -1,12 +1,16 @@
 """
 Domain models for the preprocessing service.
 """
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import List, Dict, Any, Optional
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+# OHLCV column arrays: one-dimensional float32 or float64
+FloatArray = npt.NDArray[np.floating]
+
 
 class InterpolationMethod(Enum):
     """Methods for handling missing values"""
@@ -33,63 +37,111 @@ class AggregationMethod(Enum):
     MEDIAN = "median"
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSeriesData:
-    """Domain model for OHLCV time series data"""
-    timestamps: List[datetime]
-    open: List[float]
-    high: List[float]
-    low: List[float]
-    close: List[float]
-    volume: List[float]
+    """
+    Domain model for OHLCV time series data.
+    
+    Stored column-wise (struct of arrays): OHLCV values are arrays of `dtype`
+    and timestamps a DatetimeIndex (a datetime64 buffer that keeps the timezone).
+    Lists passed to the constructor are converted on initialization.
+    
+    `dtype` defaults to float64; float32 halves memory traffic for the numeric
+    adapters but is only exact for integers up to 2**24, which share volumes
+    can exceed, so it is opt-in.
+    
+    The DataFrame view built by to_dataframe() is cached and dropped whenever
+    a field is reassigned; in-place edits to the arrays show through it.
+    Fields are slotted, so instances carry no per-instance __dict__.
+    """
+    timestamps: pd.DatetimeIndex
+    open: FloatArray
+    high: FloatArray
+    low: FloatArray
+    close: FloatArray
+    volume: FloatArray
     metadata: dict = field(default_factory=dict)
     features: Optional[List[dict]] = None
+    dtype: type = np.float64
+    _df: Optional[pd.DataFrame] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != '_df':
+            object.__setattr__(self, '_df', None)
+    
+    def __post_init__(self):
+        """Coerce columns to arrays; no copy if they already are"""
+        self.timestamps = pd.DatetimeIndex(self.timestamps)
+        self.open = np.asarray(self.open, dtype=self.dtype)
+        self.high = np.asarray(self.high, dtype=self.dtype)
+        self.low = np.asarray(self.low, dtype=self.dtype)
+        self.close = np.asarray(self.close, dtype=self.dtype)
+        self.volume = np.asarray(self.volume, dtype=self.dtype)
     
     # Backward compatibility: provide 'values' as alias for 'close'
     @property
-    def values(self) -> List[float]:
+    def values(self) -> FloatArray:
         """Alias for close prices for backward compatibility"""
         return self.close
     
     @classmethod
-    def from_dataframe(cls, df: pd.DataFrame, metadata: dict = None) -> 'TimeSeriesData':
-        """Create TimeSeriesData from DataFrame with OHLCV columns"""
+    def from_dataframe(
+        cls, 
+        df: pd.DataFrame, 
+        metadata: dict = None, 
+        dtype: type = np.float64
+    ) -> 'TimeSeriesData':
+        """Create TimeSeriesData from DataFrame with OHLCV columns, stored as `dtype`"""
         # Extract features if present
         features = None
         if 'features' in df.columns:
             features = df['features'].tolist()
         
+        timestamps = pd.DatetimeIndex(df['timestamp'])
+        
         # Check if we have OHLCV data or legacy single-value data
         if all(col in df.columns for col in ['open', 'high', 'low', 'close', 'volume']):
             # OHLCV format
             return cls(
-                timestamps=df['timestamp'].tolist(),
-                open=df['open'].tolist(),
-                high=df['high'].tolist(),
-                low=df['low'].tolist(),
-                close=df['close'].tolist(),
-                volume=df['volume'].tolist(),
+                timestamps=timestamps,
+                open=df['open'].to_numpy(dtype=dtype),
+                high=df['high'].to_numpy(dtype=dtype),
+                low=df['low'].to_numpy(dtype=dtype),
+                close=df['close'].to_numpy(dtype=dtype),
+                volume=df['volume'].to_numpy(dtype=dtype),
                 metadata=metadata or {},
-                features=features
+                features=features,
+                dtype=dtype
             )
         elif 'value' in df.columns:
             # Legacy single-value format - use value for all OHLC, set volume to 0
-            values = df['value'].tolist()
+            values = df['value'].to_numpy(dtype=dtype)
             return cls(
-                timestamps=df['timestamp'].tolist(),
+                timestamps=timestamps,
                 open=values,
                 high=values,
                 low=values,
                 close=values,
-                volume=[0.0] * len(values),
+                volume=np.zeros(len(values), dtype=dtype),
                 metadata=metadata or {},
-                features=features
+                features=features,
+                dtype=dtype
             )
         else:
             raise ValueError("DataFrame must contain either OHLCV columns or 'value' column")
     
     def to_dataframe(self) -> pd.DataFrame:
-        """Convert to pandas DataFrame with OHLCV columns"""
+        """
+        Convert to pandas DataFrame with OHLCV columns, wrapping the arrays
+        without copying. The frame is built once and each call returns a
+        shallow (copy-on-write) copy, so callers may modify it freely.
+        """
+        if self._df is None:
+            self._df = self._build_dataframe()
+        return self._df.copy(deep=False)
+    
+    def _build_dataframe(self) -> pd.DataFrame:
         df = pd.DataFrame({
             'timestamp': self.timestamps,
             'open': self.open,
@@ -97,7 +149,7 @@ class TimeSeriesData:
             'low': self.low,
             'close': self.close,
             'volume': self.volume
-        })
+        }, copy=False)
         
         # Add features if they exist
         if self.features is not None:
@@ -105,7 +157,7 @@ class TimeSeriesData:
         
         return df
     
-    def get_price_column(self, column: str = 'close') -> List[float]:
+    def get_price_column(self, column: str = 'close') -> FloatArray:
         """
         Get a specific price column for processing.
         
@@ -113,7 +165,7 @@ class TimeSeriesData:
             column: One of 'open', 'high', 'low', 'close', or 'volume'
             
         Returns:
-            List of values for the specified column
+            Array of values for the specified column
         """
         column_map = {
             'open': self.open,
@@ -128,15 +180,62 @@ class TimeSeriesData:
         
         return column_map[column]
     
+    def get_column_array(self, column: str = 'close') -> FloatArray:
+        """
+        Get an OHLCV column as an array of the series' dtype for vectorized
+        processing, without building a DataFrame. Returns the stored array, not a copy.
+        
+        Args:
+            column: One of 'open', 'high', 'low', 'close', or 'volume'
+            
+        Returns:
+            NumPy array of the column values
+        """
+        return np.asarray(self.get_price_column(column), dtype=self.dtype)
+    
+    def astype(self, dtype: type) -> 'TimeSeriesData':
+        """
+        Return the series with OHLCV columns stored as `dtype`; self if it already is.
+        
+        Args:
+            dtype: Target float type (np.float32 or np.float64)
+        """
+        if np.dtype(dtype) == np.dtype(self.dtype):
+            return self
+        return replace(self, dtype=dtype)
+    
+    def take(self, positions: np.ndarray) -> 'TimeSeriesData':
+        """
+        Select rows by integer position, indexing each column array once.
+        
+        Args:
+            positions: Integer positions of the rows to keep
+            
+        Returns:
+            New TimeSeriesData with the selected rows and the same metadata
+        """
+        return TimeSeriesData(
+            timestamps=self.timestamps[positions],
+            open=self.open[positions],
+            high=self.high[positions],
+            low=self.low[positions],
+            close=self.close[positions],
+            volume=self.volume[positions],
+            metadata=self.metadata,
+            features=None if self.features is None else [self.features[i] for i in positions],
+            dtype=self.dtype
+        )
+    
     def __len__(self):
         return len(self.close)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PreprocessingConfig:
     """
     Configuration for preprocessing operations.
     Encapsulates all parameters needed for the preprocessing pipeline.
+    Immutable, so one instance can be shared between requests and events.
     """
     interpolation_method: InterpolationMethod = InterpolationMethod.LINEAR
     outlier_method: OutlierMethod = OutlierMethod.ZSCORE
@@ -146,6 +245,7 @@ class PreprocessingConfig:
     lag_features: List[int] = None
     rolling_window_sizes: List[int] = None
     price_column: str = 'close'  # Which price column to use for features/outlier detection
+    value_dtype: type = np.float64  # np.float32 halves memory traffic; volumes above 2**24 lose precision
     
     def __post_init__(self):
         """Validate configuration after initialization"""
@@ -160,4 +260,17 @@ class PreprocessingConfig:
         
         valid_price_columns = ['open', 'high', 'low', 'close']
         if self.price_column not in valid_price_columns:
-            raise ValueError(f"price_column must be one of {valid_price_columns}")
\ No newline at end of file
+            raise ValueError(f"price_column must be one of {valid_price_columns}")
+        
+        if np.dtype(self.value_dtype) not in (np.float32, np.float64):
+            raise ValueError("value_dtype must be np.float32 or np.float64")
+
+
+@dataclass(slots=True)
+class BatchPreprocessingResult:
+    """
+    Outcome of preprocessing several series together. Every requested
+    series ends up in exactly one of the two dicts, keyed by series_id.
+    """
+    results: Dict[str, TimeSeriesData] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
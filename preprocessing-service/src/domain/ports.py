@@ -2,19 +2,39 @@
 Ports (interfaces) defining the contracts between core business logic and adapters.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
+import numpy as np
 import pandas as pd
 from .models import TimeSeriesData, InterpolationMethod, OutlierMethod, AggregationMethod
 
 
+class SeriesNotFoundError(ValueError):
+    """Raised by repositories when a series has no stored data"""
+
+
 class ITimeSeriesRepository(ABC):
     """Port for time series data persistence"""
     
     @abstractmethod
     def get_raw_data(self, series_id: str) -> TimeSeriesData:
-        """Retrieve raw time series data by ID"""
+        """
+        Retrieve raw time series data by ID.
+        
+        The caller owns the returned data and may modify its arrays in place,
+        so implementations that keep series in memory must return a copy.
+        """
         pass
     
+    def get_raw_data_many(self, series_ids: Sequence[str]) -> Dict[str, TimeSeriesData]:
+        """Raw data for several series keyed by ID, owned by the caller as with get_raw_data; IDs without data are left out"""
+        result = {}
+        for series_id in dict.fromkeys(series_ids):
+            try:
+                result[series_id] = self.get_raw_data(series_id)
+            except SeriesNotFoundError:
+                continue
+        return result
+    
     @abstractmethod
     def save_preprocessed_data(self, series_id: str, data: TimeSeriesData) -> bool:
         """Save preprocessed time series data"""
@@ -24,6 +44,13 @@ class ITimeSeriesRepository(ABC):
     def get_preprocessed_data(self, series_id: str) -> TimeSeriesData:
         """Retrieve preprocessed time series data by ID"""
         pass
+    
+    def get_preprocessed_or_raw(self, series_id: str) -> TimeSeriesData:
+        """Preprocessed data if stored, otherwise raw data; only a miss falls through"""
+        try:
+            return self.get_preprocessed_data(series_id)
+        except SeriesNotFoundError:
+            return self.get_raw_data(series_id)
 
 
 class IMissingValueHandler(ABC):
@@ -37,6 +64,16 @@ class IMissingValueHandler(ABC):
     ) -> TimeSeriesData:
         """Fill missing values using specified method"""
         pass
+    
+    def handle_missing_inplace(
+        self, 
+        data: TimeSeriesData, 
+        method: InterpolationMethod
+    ) -> None:
+        """Fill missing values into `data` itself; defaults to handle_missing"""
+        filled = self.handle_missing(data, method)
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            setattr(data, col, getattr(filled, col))
 
 
 class IOutlierDetector(ABC):
@@ -47,19 +84,33 @@ class IOutlierDetector(ABC):
         self, 
         data: TimeSeriesData, 
         method: OutlierMethod, 
-        threshold: float
+        threshold: float,
+        price_column: str = 'close'
     ) -> TimeSeriesData:
-        """Detect and remove outliers using specified method"""
+        """Detect and remove outliers in `price_column` using specified method"""
         pass
     
+    def detect_and_remove_inplace(
+        self, 
+        data: TimeSeriesData, 
+        method: OutlierMethod, 
+        threshold: float,
+        price_column: str = 'close'
+    ) -> None:
+        """Drop outlier rows from `data` itself; defaults to detect_and_remove"""
+        kept = self.detect_and_remove(data, method, threshold, price_column)
+        for name in ('timestamps', 'open', 'high', 'low', 'close', 'volume', 'features'):
+            setattr(data, name, getattr(kept, name))
+    
     @abstractmethod
     def detect_only(
         self, 
         data: TimeSeriesData, 
         method: OutlierMethod, 
-        threshold: float
-    ) -> List[int]:
-        """Detect outlier indices without removing them"""
+        threshold: float,
+        price_column: str = 'close'
+    ) -> np.ndarray:
+        """Detect outlier positions in `price_column` without removing them"""
         pass
 
 
@@ -70,7 +121,7 @@ class IFeatureEngineer(ABC):
     def create_lag_features(
         self, 
         data: TimeSeriesData, 
-        lags: List[int]
+        lags: Sequence[int]
     ) -> pd.DataFrame:
         """Create lagged features"""
         pass
@@ -79,7 +130,7 @@ class IFeatureEngineer(ABC):
     def create_rolling_features(
         self, 
         data: TimeSeriesData, 
-        windows: List[int]
+        windows: Sequence[int]
     ) -> pd.DataFrame:
         """Create rolling window statistics features"""
         pass
@@ -88,6 +139,19 @@ class IFeatureEngineer(ABC):
     def create_time_features(self, data: TimeSeriesData) -> pd.DataFrame:
         """Create time-based features (hour, day, month, etc.)"""
         pass
+    
+    def create_features(
+        self, 
+        data: TimeSeriesData, 
+        lags: Sequence[int], 
+        windows: Sequence[int]
+    ) -> pd.DataFrame:
+        """Lag, rolling and time features as one frame; adapters may fuse the steps"""
+        return pd.concat([
+            self.create_lag_features(data, lags),
+            self.create_rolling_features(data, windows),
+            self.create_time_features(data),
+        ], axis=1)
 
 
 class IResampler(ABC):
@@ -108,13 +172,13 @@ class ILogger(ABC):
     """Port for logging operations"""
     
     @abstractmethod
-    def info(self, message: str):
-        """Log informational message"""
+    def info(self, message: str, *args):
+        """Log informational message; args are %-formatted into it only if emitted"""
         pass
     
     @abstractmethod
-    def warning(self, message: str):
-        """Log warning message"""
+    def warning(self, message: str, *args):
+        """Log warning message; args are %-formatted into it only if emitted"""
         pass
     
     @abstractmethod
@@ -123,9 +187,13 @@ class ILogger(ABC):
         pass
     
     @abstractmethod
-    def debug(self, message: str):
-        """Log debug message"""
+    def debug(self, message: str, *args):
+        """Log debug message; args are %-formatted into it only if emitted"""
         pass
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether messages at a `logging` level would be emitted, to skip costly arguments"""
+        return True
 
 
 class IEventPublisher(ABC):
@@ -1,20 +1,45 @@
 """
 Core business logic for preprocessing time series data.
 """
-from typing import Optional
+from dataclasses import replace
+from typing import Dict, Optional, Sequence
+import numpy as np
 import pandas as pd
 import json
-from .models import TimeSeriesData, PreprocessingConfig
+import logging
+from .models import TimeSeriesData, PreprocessingConfig, BatchPreprocessingResult
 from .ports import (
     ITimeSeriesRepository,
     IMissingValueHandler,
     IOutlierDetector,
     IFeatureEngineer,
     IResampler,
-    ILogger
+    ILogger,
+    SeriesNotFoundError
 )
 
 
+def _rows_to_feature_dicts(features_df: pd.DataFrame) -> list:
+    """
+    Turn a feature frame into one dict per row (the JSONB payload), NaN -> None.
+    
+    Numeric frames are converted as a single float block with one NaN mask
+    instead of a per-row apply; other frames keep the row-wise conversion.
+    """
+    columns = features_df.columns.tolist()
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in features_df.dtypes):
+        block = features_df.to_numpy(dtype=np.float64)
+        values = block.astype(object)
+        values[np.isnan(block)] = None
+        return [dict(zip(columns, row)) for row in values.tolist()]
+    
+    return features_df.apply(
+        lambda row: {k: (None if pd.isna(v) else float(v) if isinstance(v, (int, float)) else v) 
+                    for k, v in row.to_dict().items()}, 
+        axis=1
+    ).tolist()
+
+
 class PreprocessingService:
     """
     Core preprocessing service implementing the business logic.
@@ -53,66 +78,112 @@ class PreprocessingService:
             Preprocessed time series data with features
         """
         try:
-            self.logger.info(f"Starting preprocessing for series: {series_id}")
+            self.logger.info("Starting preprocessing for series: %s", series_id)
             
             # Step 1: Retrieve raw data
             data = self.repository.get_raw_data(series_id)
-            original_count = len(data)
-            self.logger.info(f"Retrieved {original_count} data points")
+            return self._run_pipeline(series_id, data, config)
             
-            # Step 2: Handle missing values (apply to all OHLCV columns)
-            data = self.missing_handler.handle_missing(
-                data, 
-                config.interpolation_method
-            )
-            self.logger.info(
-                f"Missing values handled using {config.interpolation_method.value}"
-            )
+        except Exception as e:
+            self.logger.error(f"Preprocessing failed for {series_id}", e)
+            raise
+    
+    def preprocess_batch(
+        self, 
+        series_ids: Sequence[str], 
+        config: PreprocessingConfig
+    ) -> BatchPreprocessingResult:
+        """
+        Run the preprocessing pipeline for several series, fetching all raw
+        data with a single repository call instead of one query per series.
+        
+        Args:
+            series_ids: Identifiers of the time series to preprocess
+            config: Preprocessing configuration shared by every series
             
-            # Step 3: Detect and remove outliers (based on configured price column)
-            data = self.outlier_detector.detect_and_remove(
+        Returns:
+            Preprocessed data and per-series errors, keyed by series_id. A
+            series without raw data is recorded as a SeriesNotFoundError; a
+            failing series is logged and does not affect the others
+        """
+        self.logger.info("Starting batch preprocessing for %d series", len(series_ids))
+        raw = self.repository.get_raw_data_many(series_ids)
+        batch = BatchPreprocessingResult()
+        
+        missing = [series_id for series_id in dict.fromkeys(series_ids) if series_id not in raw]
+        if missing:
+            self.logger.warning("No raw data found for %d series: %s", len(missing), missing)
+            for series_id in missing:
+                batch.errors[series_id] = SeriesNotFoundError(f"No raw data found for {series_id}")
+        
+        for series_id, data in raw.items():
+            try:
+                batch.results[series_id] = self._run_pipeline(series_id, data, config)
+            except Exception as e:
+                self.logger.error(f"Preprocessing failed for {series_id}", e)
+                batch.errors[series_id] = e
+        return batch
+    
+    def _run_pipeline(
+        self, 
+        series_id: str, 
+        data: TimeSeriesData, 
+        config: PreprocessingConfig
+    ) -> TimeSeriesData:
+        """Steps 2-6 of the pipeline on freshly fetched raw data, which it may modify"""
+        data = data.astype(config.value_dtype)
+        original_count = len(data)
+        self.logger.info("Retrieved %d data points", original_count)
+        
+        # Step 2: Handle missing values (apply to all OHLCV columns)
+        # The freshly fetched series is owned here, so stages work in place
+        self.missing_handler.handle_missing_inplace(
+            data, 
+            config.interpolation_method
+        )
+        self.logger.info(
+            "Missing values handled using %s", config.interpolation_method.value
+        )
+        
+        # Step 3: Detect and remove outliers (based on configured price column)
+        self.outlier_detector.detect_and_remove_inplace(
+            data, 
+            config.outlier_method, 
+            config.outlier_threshold,
+            config.price_column
+        )
+        self.logger.info(
+            "Outliers processed: %d points removed using %s",
+            original_count - len(data), config.outlier_method.value
+        )
+        
+        # Step 4: Resample if frequency specified
+        if config.resample_frequency:
+            data = self.resampler.resample(
                 data, 
-                config.outlier_method, 
-                config.outlier_threshold,
-                config.price_column
+                config.resample_frequency, 
+                config.aggregation_method
             )
-            removed_count = original_count - len(data)
             self.logger.info(
-                f"Outliers processed: {removed_count} points removed "
-                f"using {config.outlier_method.value}"
+                "Resampled to %s using %s",
+                config.resample_frequency, config.aggregation_method.value
             )
-            
-            # Step 4: Resample if frequency specified
-            if config.resample_frequency:
-                data = self.resampler.resample(
-                    data, 
-                    config.resample_frequency, 
-                    config.aggregation_method
-                )
-                self.logger.info(
-                    f"Resampled to {config.resample_frequency} "
-                    f"using {config.aggregation_method.value}"
-                )
-            
-            # Step 5: Feature Engineering
-            features_dict = self._create_features_dict(data, config)
-            
-            # Attach features to the data
-            data = self._attach_features_to_data(data, features_dict)
-            self.logger.info(f"Created {len(features_dict)} feature columns")
-            
-            # Step 6: Save preprocessed data with features
-            success = self.repository.save_preprocessed_data(series_id, data)
-            if success:
-                self.logger.info("Preprocessing completed successfully")
-            else:
-                self.logger.warning("Failed to save preprocessed data")
-            
-            return data
-            
-        except Exception as e:
-            self.logger.error(f"Preprocessing failed for {series_id}", e)
-            raise
+        
+        # Step 5: Feature Engineering
+        features_dict = self._create_features_dict(data, config)
+        
+        # Attach features to the data
+        data = self._attach_features_to_data(data, features_dict)
+        self.logger.info("Created %d feature columns", len(features_dict))
+        
+        # Step 6: Save preprocessed data with features
+        success = self.repository.save_preprocessed_data(series_id, data)
+        if success:
+            self.logger.info("Preprocessing completed successfully")
+        else:
+            self.logger.warning("Failed to save preprocessed data")
+        
+        return data
     
     def _create_features_dict(
         self, 
@@ -126,51 +197,36 @@ class PreprocessingService:
             Dictionary mapping feature names to their DataFrames
         """
         features = {}
+        # Shape/column dumps below are only built when INFO is emitted
+        verbose = self.logger.is_enabled_for(logging.INFO)
         
         # Debug: Log what config values we have
-        self.logger.info(f"Feature config - lag_features: {config.lag_features}")
-        self.logger.info(f"Feature config - rolling_window_sizes: {config.rolling_window_sizes}")
-        self.logger.info(f"Feature config - price_column: {config.price_column}")
+        self.logger.info("Feature config - lag_features: %s", config.lag_features)
+        self.logger.info("Feature config - rolling_window_sizes: %s", config.rolling_window_sizes)
+        self.logger.info("Feature config - price_column: %s", config.price_column)
         
-        # Add lag features
-        if config.lag_features:
-            lag_df = self.feature_engineer.create_lag_features(
-                data, 
-                config.lag_features
-            )
-            self.logger.info(f"Lag features shape: {lag_df.shape}, columns: {lag_df.columns.tolist()}")
-            for col in lag_df.columns:
-                features[col] = lag_df[col]
-            self.logger.info(f"Created {len(config.lag_features)} lag features")
-        
-        # Add rolling features
-        if config.rolling_window_sizes:
-            rolling_df = self.feature_engineer.create_rolling_features(
-                data, 
-                config.rolling_window_sizes
-            )
-            self.logger.info(f"Rolling features shape: {rolling_df.shape}, columns: {rolling_df.columns.tolist()}")
-            for col in rolling_df.columns:
-                features[col] = rolling_df[col]
-            self.logger.info(
-                f"Created rolling features for {len(config.rolling_window_sizes)} windows"
-            )
-        
-        # Add time-based features
-        time_df = self.feature_engineer.create_time_features(data)
-        self.logger.info(f"Time features shape: {time_df.shape}, columns: {time_df.columns.tolist()}")
-        for col in time_df.columns:
-            features[col] = time_df[col]
-        self.logger.info("Created time-based features")
+        # Lag, rolling and time features come back from a single adapter call
+        lags = config.lag_features or []
+        windows = config.rolling_window_sizes or []
+        engineered = self.feature_engineer.create_features(data, lags, windows)
+        if verbose:
+            self.logger.info("Engineered features shape: %s, columns: %s", engineered.shape, engineered.columns.tolist())
+        for col in engineered.columns:
+            features[col] = engineered[col]
+        self.logger.info(
+            "Created %d lag features, rolling features for %d windows and time-based features",
+            len(lags), len(windows)
+        )
         
         # Add OHLCV-specific features
         ohlcv_features = self._create_ohlcv_features(data)
         for col in ohlcv_features.columns:
             features[col] = ohlcv_features[col]
-        self.logger.info(f"Created {len(ohlcv_features.columns)} OHLCV-specific features")
+        self.logger.info("Created %d OHLCV-specific features", len(ohlcv_features.columns))
         
         # Debug: Log total features created
-        self.logger.info(f"Total features dictionary keys: {list(features.keys())}")
+        if verbose:
+            self.logger.info("Total features dictionary keys: %s", list(features.keys()))
         
         return features
     
@@ -181,29 +237,39 @@ class PreprocessingService:
         Returns:
             DataFrame with OHLCV-derived features
         """
-        df = data.to_dataframe()
-        features = pd.DataFrame(index=df.index)
-        
-        # Price range features
-        features['price_range'] = df['high'] - df['low']
-        features['price_range_pct'] = (df['high'] - df['low']) / df['close'] * 100
-        
-        # Body and wick features (candlestick analysis)
-        features['body'] = df['close'] - df['open']
-        features['body_pct'] = (df['close'] - df['open']) / df['open'] * 100
-        features['upper_wick'] = df['high'] - df[['open', 'close']].max(axis=1)
-        features['lower_wick'] = df[['open', 'close']].min(axis=1) - df['low']
+        open_, high, low, close, volume = (
+            data.get_column_array(col) for col in ['open', 'high', 'low', 'close', 'volume']
+        )
+        price_range = high - low
+        typical_price = (high + low + close) / 3
+        body = close - open_
         
-        # Price position within range
-        features['close_position'] = (df['close'] - df['low']) / (df['high'] - df['low'])
-        
-        # Volume-weighted features
-        features['vwap'] = (df['high'] + df['low'] + df['close']) / 3 * df['volume']
-        
-        # Typical price (used in many technical indicators)
-        features['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
+        # Collect columns first and build the frame once. A zero price or
+        # range yields inf/NaN, as the equivalent Series arithmetic would
+        with np.errstate(divide='ignore', invalid='ignore'):
+            features = {
+                # Price range features
+                'price_range': price_range,
+                'price_range_pct': price_range / close * 100,
+                
+                # Body and wick features (candlestick analysis); fmax/fmin
+                # skip a NaN operand like a row-wise max/min
+                'body': body,
+                'body_pct': body / open_ * 100,
+                'upper_wick': high - np.fmax(open_, close),
+                'lower_wick': np.fmin(open_, close) - low,
+                
+                # Price position within range
+                'close_position': (close - low) / price_range,
+                
+                # Volume-weighted features
+                'vwap': typical_price * volume,
+                
+                # Typical price (used in many technical indicators)
+                'typical_price': typical_price,
+            }
         
-        return features
+        return pd.DataFrame(features, index=pd.RangeIndex(len(close)), copy=False)
     
     def _attach_features_to_data(
         self, 
@@ -215,36 +281,33 @@ class PreprocessingService:
         
         Features are stored as JSONB in the database, one JSON object per timestamp.
         """
-        df = data.to_dataframe()
+        n = len(data.timestamps)
+        verbose = self.logger.is_enabled_for(logging.INFO)
         
         # Debug log
-        self.logger.info(f"Original dataframe shape: {df.shape}")
-        self.logger.info(f"Features dict has {len(features_dict)} keys")
+        self.logger.info("Original data rows: %d", n)
+        self.logger.info("Features dict has %d keys", len(features_dict))
         
         # Create a features column with JSON objects for each row
         if features_dict:
             # Convert the features dict (which has Series as values) into a DataFrame
             features_df = pd.DataFrame(features_dict)
             
-            self.logger.info(f"Features dataframe shape: {features_df.shape}")
-            self.logger.info(f"Features dataframe columns: {features_df.columns.tolist()}")
+            self.logger.info("Features dataframe shape: %s", features_df.shape)
+            if verbose:
+                self.logger.info("Features dataframe columns: %s", features_df.columns.tolist())
             
-            # Convert each row to a dictionary (JSON object)
-            # Handle NaN values by converting to None
-            df['features'] = features_df.apply(
-                lambda row: {k: (None if pd.isna(v) else float(v) if isinstance(v, (int, float)) else v) 
-                            for k, v in row.to_dict().items()}, 
-                axis=1
-            )
+            features = _rows_to_feature_dicts(features_df)
             
-            self.logger.info(f"Sample feature object: {df['features'].iloc[0]}")
+            if features:
+                self.logger.info("Sample feature object: %s", features[0])
         else:
             # Empty features if none were created
             self.logger.warning("No features were created, using empty dict")
-            df['features'] = [{}] * len(df)
+            features = [{} for _ in range(n)]
         
         # Update the data object with the features column
-        data = TimeSeriesData.from_dataframe(df, data.metadata)
+        data = replace(data, features=features)
         
         return data
     
@@ -264,47 +327,31 @@ class PreprocessingService:
             DataFrame with original data and engineered features
         """
         try:
-            self.logger.info(f"Creating features for series: {series_id}")
+            self.logger.info("Creating features for series: %s", series_id)
             
             # Get preprocessed data if available, otherwise raw data
-            try:
-                data = self.repository.get_preprocessed_data(series_id)
-            except:
-                data = self.repository.get_raw_data(series_id)
-            
-            df = data.to_dataframe()
-            
-            # Add lag features
-            if config.lag_features:
-                lag_df = self.feature_engineer.create_lag_features(
-                    data, 
-                    config.lag_features
-                )
-                df = pd.concat([df, lag_df], axis=1)
-                self.logger.info(f"Created {len(config.lag_features)} lag features")
+            data = self.repository.get_preprocessed_or_raw(series_id)
             
-            # Add rolling features
-            if config.rolling_window_sizes:
-                rolling_df = self.feature_engineer.create_rolling_features(
-                    data, 
-                    config.rolling_window_sizes
-                )
-                df = pd.concat([df, rolling_df], axis=1)
-                self.logger.info(
-                    f"Created rolling features for {len(config.rolling_window_sizes)} windows"
-                )
+            # Collect every block and join them in a single concat at the end
+            frames = [data.to_dataframe()]
             
-            # Add time-based features
-            time_df = self.feature_engineer.create_time_features(data)
-            df = pd.concat([df, time_df], axis=1)
-            self.logger.info("Created time-based features")
+            # Lag, rolling and time features come back from a single adapter call
+            lags = config.lag_features or []
+            windows = config.rolling_window_sizes or []
+            frames.append(self.feature_engineer.create_features(data, lags, windows))
+            self.logger.info(
+                "Created %d lag features, rolling features for %d windows and time-based features",
+                len(lags), len(windows)
+            )
             
             # Add OHLCV-specific features
             ohlcv_features = self._create_ohlcv_features(data)
-            df = pd.concat([df, ohlcv_features], axis=1)
+            frames.append(ohlcv_features)
             self.logger.info("Created OHLCV-specific features")
             
-            self.logger.info(f"Feature creation completed: {len(df.columns)} total features")
+            df = pd.concat(frames, axis=1)
+            
+            self.logger.info("Feature creation completed: %d total features", len(df.columns))
             return df
             
         except Exception as e:
@@ -322,34 +369,43 @@ class PreprocessingService:
             self.logger.info("Validating data now")
             data = self.repository.get_raw_data(series_id)
             self.logger.info("Got raw data")
-            df = data.to_dataframe()
+            n = len(data.timestamps)
+            columns = {
+                col: data.get_column_array(col)
+                for col in ['open', 'high', 'low', 'close', 'volume']
+            }
             
-            # Calculate statistics for each OHLCV column
+            # Calculate statistics for each OHLCV column: one NaN mask per
+            # column, then every reduction runs on the compacted valid values
             ohlcv_stats = {}
-            for col in ['open', 'high', 'low', 'close', 'volume']:
+            for col, values in columns.items():
+                missing = np.isnan(values)
+                missing_count = int(np.count_nonzero(missing))
+                valid = values[~missing].astype(np.float64, copy=False)
                 ohlcv_stats[col] = {
-                    'missing_count': int(df[col].isna().sum()),
-                    'missing_percentage': float((df[col].isna().sum() / len(df)) * 100),
-                    'mean': float(df[col].mean()),
-                    'std': float(df[col].std()),
-                    'min': float(df[col].min()),
-                    'max': float(df[col].max())
+                    'missing_count': missing_count,
+                    'missing_percentage': float(missing_count / n * 100),
+                    'mean': float(valid.mean()) if valid.size else float('nan'),
+                    'std': float(valid.std(ddof=1)) if valid.size > 1 else float('nan'),
+                    'min': float(valid.min()) if valid.size else float('nan'),
+                    'max': float(valid.max()) if valid.size else float('nan')
                 }
             
+            high, low = columns['high'], columns['low']
             validation = {
-                'total_points': len(df),
+                'total_points': n,
                 'date_range': {
-                    'start': df['timestamp'].min().isoformat(),
-                    'end': df['timestamp'].max().isoformat()
+                    'start': data.timestamps.min().isoformat(),
+                    'end': data.timestamps.max().isoformat()
                 },
                 'ohlcv_stats': ohlcv_stats,
                 'data_quality_checks': {
-                    'high_ge_low': int((df['high'] >= df['low']).sum()),
-                    'high_ge_open': int((df['high'] >= df['open']).sum()),
-                    'high_ge_close': int((df['high'] >= df['close']).sum()),
-                    'low_le_open': int((df['low'] <= df['open']).sum()),
-                    'low_le_close': int((df['low'] <= df['close']).sum()),
-                    'volume_positive': int((df['volume'] > 0).sum())
+                    'high_ge_low': int(np.count_nonzero(high >= low)),
+                    'high_ge_open': int(np.count_nonzero(high >= columns['open'])),
+                    'high_ge_close': int(np.count_nonzero(high >= columns['close'])),
+                    'low_le_open': int(np.count_nonzero(low <= columns['open'])),
+                    'low_le_close': int(np.count_nonzero(low <= columns['close'])),
+                    'volume_positive': int(np.count_nonzero(columns['volume'] > 0))
                 }
             }
 
@@ -0,0 +1,39 @@
+"""
+Shared pytest setup.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from src.adapters.feature_engineering import FeatureEngineer
+from src.adapters.outlier_detection import StatisticalOutlierDetector
+from src.adapters.resampling import Resampler
+from src.domain.models import TimeSeriesData, OutlierMethod, AggregationMethod
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_numba_kernels():
+    """
+    Run every lazily compiled kernel once on a tiny series before the first
+    test, so no test pays JIT (or on-disk cache load) latency. Shared fixtures
+    freeze their arrays and Numba compiles read-only arrays separately, so
+    both variants are warmed. The fill kernels compile at import.
+    """
+    dates = pd.date_range(start='2025-01-01', periods=8, freq='h')
+    df = pd.DataFrame({
+        'timestamp': dates,
+        **{col: np.linspace(1.0, 2.0, 8) for col in ['open', 'high', 'low', 'close', 'volume']}
+    })
+    fe = FeatureEngineer()
+    detector = StatisticalOutlierDetector()
+    resampler = Resampler()
+
+    for frozen in (False, True):
+        ts_data = TimeSeriesData.from_dataframe(df.copy())
+        if frozen:
+            for col in ['open', 'high', 'low', 'close', 'volume']:
+                ts_data.get_column_array(col).flags.writeable = False
+        fe.create_features(ts_data, [1], [2, 3])
+        fe.create_rolling_features(ts_data, [2])
+        fe.create_ohlcv_features(ts_data)
+        detector.detect_and_remove(ts_data, OutlierMethod.ZSCORE, 3.0)
+        resampler.resample(ts_data, '2h', AggregationMethod.MEAN)
@@ -8,8 +8,63 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from src.adapters.feature_engineering import FeatureEngineer
-from src.domain.models import TimeSeriesData
+from src.adapters.missing_values import MissingValueHandler
+from src.adapters.outlier_detection import StatisticalOutlierDetector
+from src.adapters.resampling import Resampler
+from src.domain.models import TimeSeriesData, InterpolationMethod, OutlierMethod, AggregationMethod
+from src.domain.ports import IFeatureEngineer, IOutlierDetector
+
+
+# Random inputs drawn once per session from fixed seeds; fixtures scale slices of
+# these instead of advancing the global RNG on every test
+_UNIFORM_POOL = np.random.default_rng(0).random((5, 200))
+_STANDARD_NORMALS = np.random.default_rng(7).standard_normal(50)
+
+
+def _read_only(ts_data):
+    """Freeze the column arrays of a shared fixture so no test can modify it"""
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        getattr(ts_data, col).flags.writeable = False
+    return ts_data
+
+
+@lru_cache(maxsize=None)
+def _flat_time_series_data(start, periods, freq='D', tz=None):
+    """
+    Constant-price OHLCV series for calendar tests. Built once per argument
+    set and shared read-only, so only use it where a test does not modify data.
+    """
+    df = pd.DataFrame({
+        'timestamp': pd.date_range(start=start, periods=periods, freq=freq, tz=tz),
+        'open': np.full(periods, 100.0),
+        'high': np.full(periods, 105.0),
+        'low': np.full(periods, 95.0),
+        'close': np.full(periods, 100.0),
+        'volume': np.full(periods, 1000.0)
+    }, copy=False)
+    return _read_only(TimeSeriesData.from_dataframe(df))
+
+
+def _columns(ts_data, *names):
+    """The named column arrays, read without building a DataFrame"""
+    return tuple(ts_data.get_column_array(name) for name in names)
+
+
+@pytest.fixture(scope="module")
+def random_time_series_data():
+    """Hourly random OHLCV series, built once per module and shared read-only."""
+    dates = pd.date_range(start='2025-01-01 00:00:00', periods=200, freq='h')
+    df = pd.DataFrame({
+        'timestamp': dates,
+        'open': 90 + 20 * _UNIFORM_POOL[0],
+        'high': 95 + 20 * _UNIFORM_POOL[1],
+        'low': 85 + 20 * _UNIFORM_POOL[2],
+        'close': 90 + 20 * _UNIFORM_POOL[3],
+        'volume': 1000 + 4000 * _UNIFORM_POOL[4]
+    }, copy=False)
+    return _read_only(TimeSeriesData.from_dataframe(df))
 
 
 class TestFeatureEngineerInitialization:
@@ -29,25 +84,15 @@ class TestCreateLagFeatures:
     """Test lag feature creation."""
     
     @pytest.fixture
-    def sample_time_series_data(self):
-        """Create sample OHLCV time series data."""
-        dates = pd.date_range(start='2025-01-01', periods=100, freq='D')
-        df = pd.DataFrame({
-            'timestamp': dates,
-            'open': np.random.uniform(90, 110, 100),
-            'high': np.random.uniform(95, 115, 100),
-            'low': np.random.uniform(85, 105, 100),
-            'close': np.random.uniform(90, 110, 100),
-            'volume': np.random.uniform(1000, 5000, 100)
-        })
-        return TimeSeriesData.from_dataframe(df)
+    def sample_time_series_data(self, random_time_series_data):
+        return random_time_series_data
     
     def test_create_lag_features_single_lag(self, sample_time_series_data):
         fe = FeatureEngineer(price_column='close')
         lag_features = fe.create_lag_features(sample_time_series_data, lags=[1])
         
         assert 'lag_1' in lag_features.columns
-        assert len(lag_features) == len(sample_time_series_data.to_dataframe())
+        assert len(lag_features) == len(sample_time_series_data.timestamps)
         assert pd.isna(lag_features.iloc[0]['lag_1'])
     
     def test_create_lag_features_multiple_lags(self, sample_time_series_data):
@@ -79,22 +124,36 @@ class TestCreateLagFeatures:
         assert lag_features.iloc[7]['lag_7'] == df.iloc[0]['close']
         assert lag_features.iloc[10]['lag_1'] == df.iloc[9]['close']
 
+    def test_create_lag_features_matches_pandas_shift(self, sample_time_series_data):
+        fe = FeatureEngineer(price_column='close')
+        lags = [0, 1, -2, 250]
+        lag_features = fe.create_lag_features(sample_time_series_data, lags=lags)
+
+        df = sample_time_series_data.to_dataframe()
+        for lag in lags:
+            pd.testing.assert_series_equal(
+                lag_features[f'lag_{lag}'],
+                df['close'].shift(lag),
+                check_names=False
+            )
+
 
 class TestCreateRollingFeatures:
     """Test rolling window feature creation."""
     
-    @pytest.fixture
-    def sample_time_series_data(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_time_series_data(cls):
         dates = pd.date_range(start='2025-01-01', periods=100, freq='D')
         df = pd.DataFrame({
             'timestamp': dates,
-            'open': np.arange(100) + 100,
-            'high': np.arange(100) + 105,
-            'low': np.arange(100) + 95,
-            'close': np.arange(100) + 100,
-            'volume': np.arange(100) * 10
-        })
-        return TimeSeriesData.from_dataframe(df)
+            'open': np.arange(100, 200, dtype=np.float64),
+            'high': np.arange(105, 205, dtype=np.float64),
+            'low': np.arange(95, 195, dtype=np.float64),
+            'close': np.arange(100, 200, dtype=np.float64),
+            'volume': np.arange(0, 1000, 10, dtype=np.float64)
+        }, copy=False)
+        return _read_only(TimeSeriesData.from_dataframe(df))
     
     def test_create_rolling_features_single_window(self, sample_time_series_data):
         fe = FeatureEngineer(price_column='close')
@@ -138,56 +197,61 @@ class TestCreateRollingFeatures:
         df = sample_time_series_data.to_dataframe()
         window_data = df['close'].iloc[0:10]
         
-        assert rolling_features.iloc[9]['rolling_std_10'] == window_data.std()
+        # One-pass Welford std; pandas uses a different summation order
+        assert rolling_features.iloc[9]['rolling_std_10'] == pytest.approx(window_data.std(), rel=1e-10)
         assert rolling_features.iloc[9]['rolling_min_10'] == window_data.min()
         assert rolling_features.iloc[9]['rolling_max_10'] == window_data.max()
 
+    def test_create_rolling_features_matches_pandas_rolling(self):
+        dates = pd.date_range(start='2025-01-01', periods=500, freq='D')
+        rng = np.random.default_rng(0)
+        close = rng.normal(100, 5, 500)
+        close[rng.integers(0, 500, 25)] = np.nan
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000] * 500
+        })
+        ts_data = TimeSeriesData.from_dataframe(df)
+        fe = FeatureEngineer(price_column='close')
+        rolling_features = fe.create_rolling_features(ts_data, windows=[3, 20])
+
+        for window in [3, 20]:
+            rolling = pd.Series(close).rolling(window=window)
+            for stat in ['mean', 'std', 'min', 'max']:
+                np.testing.assert_allclose(
+                    rolling_features[f'rolling_{stat}_{window}'].to_numpy(),
+                    getattr(rolling, stat)().to_numpy(),
+                    rtol=1e-9,
+                    atol=1e-6
+                )
+
 
 class TestCreateTimeFeatures:
     """Test time-based feature creation."""
     
-    @pytest.fixture
-    def sample_time_series_data(self):
-        dates = pd.date_range(start='2025-01-01 00:00:00', periods=200, freq='h')
-
-        df = pd.DataFrame({
-            'timestamp': dates,
-            'open': np.random.uniform(90, 110, 200),
-            'high': np.random.uniform(95, 115, 200),
-            'low': np.random.uniform(85, 105, 200),
-            'close': np.random.uniform(90, 110, 200),
-            'volume': np.random.uniform(1000, 5000, 200)
-        })
-        return TimeSeriesData.from_dataframe(df)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def time_features(cls, random_time_series_data):
+        return FeatureEngineer().create_time_features(random_time_series_data)
     
-    def test_create_time_features_column_names(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        time_features = fe.create_time_features(sample_time_series_data)
-        
+    def test_create_time_features_column_names(self, time_features):
         expected_columns = [
             'hour', 'day_of_week', 'day_of_month', 'month', 'quarter', 'year',
             'is_weekend', 'month_sin', 'month_cos', 'day_of_week_sin', 'day_of_week_cos'
         ]
         assert all(col in time_features.columns for col in expected_columns)
     
-    def test_create_time_features_hour_extraction(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        time_features = fe.create_time_features(sample_time_series_data)
-        
-        assert time_features.iloc[0]['hour'] == 0
-        assert time_features.iloc[5]['hour'] == 5
+    def test_create_time_features_hour_extraction(self, time_features):
+        hour = time_features['hour'].to_numpy()
+        assert hour[0] == 0
+        assert hour[5] == 5
     
     def test_create_time_features_weekend_detection(self):
-        dates = pd.date_range(start='2025-01-04', periods=7, freq='D')  # Saturday start
-        df = pd.DataFrame({
-            'timestamp': dates,
-            'open': [100] * 7,
-            'high': [105] * 7,
-            'low': [95] * 7,
-            'close': [100] * 7,
-            'volume': [1000] * 7
-        })
-        ts_data = TimeSeriesData.from_dataframe(df)
+        ts_data = _flat_time_series_data('2025-01-04', 7)  # Saturday start
         fe = FeatureEngineer()
         time_features = fe.create_time_features(ts_data)
         
@@ -195,54 +259,97 @@ class TestCreateTimeFeatures:
         assert time_features.iloc[1]['is_weekend'] == 1  # Sunday
         assert time_features.iloc[2]['is_weekend'] == 0  # Monday
     
-    def test_create_time_features_cyclical_encoding(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        time_features = fe.create_time_features(sample_time_series_data)
-        
+    def test_create_time_features_cyclical_encoding(self, time_features):
         assert -1 <= time_features['month_sin'].max() <= 1
         assert -1 <= time_features['month_cos'].max() <= 1
         assert -1 <= time_features['day_of_week_sin'].max() <= 1
         assert -1 <= time_features['day_of_week_cos'].max() <= 1
     
     def test_create_time_features_quarter_and_year(self):
-        dates = pd.date_range(start='2025-01-01', periods=365, freq='D')
-        df = pd.DataFrame({
-            'timestamp': dates,
-            'open': [100] * 365,
-            'high': [105] * 365,
-            'low': [95] * 365,
-            'close': [100] * 365,
-            'volume': [1000] * 365
-        })
-        ts_data = TimeSeriesData.from_dataframe(df)
+        ts_data = _flat_time_series_data('2025-01-01', 365)
         fe = FeatureEngineer()
         time_features = fe.create_time_features(ts_data)
         
         assert time_features.iloc[0]['quarter'] == 1
         assert time_features.iloc[0]['year'] == 2025
         assert time_features.iloc[180]['quarter'] in [2, 3]
+    
+    @pytest.mark.parametrize("tz", [None, 'UTC', 'America/New_York'])
+    def test_create_time_features_matches_dt_accessors(self, tz):
+        ts_data = _flat_time_series_data('1969-12-25 05:30', 500, freq='17h', tz=tz)
+        dates = pd.Series(ts_data.timestamps)
+        fe = FeatureEngineer()
+        time_features = fe.create_time_features(ts_data)
+        
+        expected = {
+            'hour': dates.dt.hour,
+            'day_of_week': dates.dt.dayofweek,
+            'day_of_month': dates.dt.day,
+            'month': dates.dt.month,
+            'quarter': dates.dt.quarter,
+            'year': dates.dt.year,
+        }
+        for col, values in expected.items():
+            np.testing.assert_array_equal(time_features[col].to_numpy(), values.to_numpy())
+
+    def test_create_time_features_nat_timestamps(self):
+        timestamps = pd.DatetimeIndex(['2025-01-04 13:00', None, '2025-03-03 01:00'])
+        ts_data = TimeSeriesData(timestamps, *[np.full(3, 100.0)] * 5)
+        fe = FeatureEngineer()
+        time_features = fe.create_time_features(ts_data)
+
+        nat_row = time_features.iloc[1]
+        assert nat_row.drop('is_weekend').isna().all()
+        assert nat_row['is_weekend'] == 0
+        np.testing.assert_array_equal(time_features['hour'].to_numpy(), [13, np.nan, 1])
+        np.testing.assert_array_equal(time_features['is_weekend'].to_numpy(), [1, 0, 0])
+
+
+class TestCreateFeatures:
+    """Test the combined lag/rolling/time feature call."""
+    
+    @pytest.mark.parametrize("lags, windows", [([1, 7], [7]), ([], [3, 20]), ([2], []), ([], [])])
+    def test_create_features_matches_separate_calls(self, random_time_series_data, lags, windows):
+        fe = FeatureEngineer()
+        features = fe.create_features(random_time_series_data, lags, windows)
+        expected = IFeatureEngineer.create_features(fe, random_time_series_data, lags, windows)
+        
+        pd.testing.assert_frame_equal(features, expected)
+    
+    def test_create_features_empty_series(self):
+        df = pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        ts_data = TimeSeriesData.from_dataframe(df)
+        
+        features = FeatureEngineer().create_features(ts_data, [1], [3])
+        assert len(features) == 0
+        assert 'lag_1' in features.columns and 'rolling_max_3' in features.columns
 
 
 class TestCreateOHLCVFeatures:
     """Test OHLCV-specific technical feature creation."""
     
-    @pytest.fixture
-    def sample_time_series_data(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_time_series_data(cls):
         dates = pd.date_range(start='2025-01-01', periods=50, freq='D')
+        # One five-bar pattern per column, repeated as float64 buffers
         df = pd.DataFrame({
             'timestamp': dates,
-            'open': [100, 102, 101, 103, 99] * 10,
-            'high': [105, 107, 106, 108, 104] * 10,
-            'low': [95, 97, 96, 98, 94] * 10,
-            'close': [102, 101, 103, 99, 100] * 10,
-            'volume': [1000, 1500, 1200, 1800, 1100] * 10
-        })
-        return TimeSeriesData.from_dataframe(df)
-    
-    def test_create_ohlcv_features_column_names(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
+            'open': np.tile(np.array([100, 102, 101, 103, 99], dtype=np.float64), 10),
+            'high': np.tile(np.array([105, 107, 106, 108, 104], dtype=np.float64), 10),
+            'low': np.tile(np.array([95, 97, 96, 98, 94], dtype=np.float64), 10),
+            'close': np.tile(np.array([102, 101, 103, 99, 100], dtype=np.float64), 10),
+            'volume': np.tile(np.array([1000, 1500, 1200, 1800, 1100], dtype=np.float64), 10)
+        }, copy=False)
+        return _read_only(TimeSeriesData.from_dataframe(df))
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ohlcv_features(cls, sample_time_series_data):
+        """Feature frame computed once for the class; tests only read it."""
+        return FeatureEngineer().create_ohlcv_features(sample_time_series_data)
+    
+    def test_create_ohlcv_features_column_names(self, ohlcv_features):
         expected_columns = [
             'price_range', 'price_range_pct', 'body', 'body_pct',
             'upper_wick', 'lower_wick', 'close_position', 'vwap',
@@ -252,28 +359,17 @@ class TestCreateOHLCVFeatures:
         ]
         assert all(col in ohlcv_features.columns for col in expected_columns)
     
-    def test_create_ohlcv_features_price_range_calculation(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        expected_range = df.iloc[0]['high'] - df.iloc[0]['low']
-        assert ohlcv_features.iloc[0]['price_range'] == expected_range
+    def test_create_ohlcv_features_price_range_calculation(self, sample_time_series_data, ohlcv_features):
+        high, low = _columns(sample_time_series_data, 'high', 'low')
+        np.testing.assert_allclose(ohlcv_features['price_range'].to_numpy(), high - low)
     
-    def test_create_ohlcv_features_body_calculation(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        expected_body = df.iloc[0]['close'] - df.iloc[0]['open']
-        assert ohlcv_features.iloc[0]['body'] == expected_body
+    def test_create_ohlcv_features_body_calculation(self, sample_time_series_data, ohlcv_features):
+        open_, close = _columns(sample_time_series_data, 'open', 'close')
+        np.testing.assert_allclose(ohlcv_features['body'].to_numpy(), close - open_)
     
-    def test_create_ohlcv_features_close_position(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        assert all((ohlcv_features['close_position'] >= 0) & 
-                   (ohlcv_features['close_position'] <= 1))
+    def test_create_ohlcv_features_close_position(self, ohlcv_features):
+        close_position = ohlcv_features['close_position'].to_numpy()
+        assert np.all((close_position >= 0) & (close_position <= 1))
     
     def test_create_ohlcv_features_close_position_zero_range(self):
         dates = pd.date_range(start='2025-01-01', periods=5, freq='D')
@@ -291,61 +387,70 @@ class TestCreateOHLCVFeatures:
         
         assert ohlcv_features.iloc[0]['close_position'] == 0.5
     
-    def test_create_ohlcv_features_typical_price(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        expected_typical = (df.iloc[0]['high'] + df.iloc[0]['low'] + df.iloc[0]['close']) / 3
-        assert ohlcv_features.iloc[0]['typical_price'] == expected_typical
-    
-    def test_create_ohlcv_features_vwap_calculation(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        typical_price = (df.iloc[0]['high'] + df.iloc[0]['low'] + df.iloc[0]['close']) / 3
-        expected_vwap = typical_price * df.iloc[0]['volume']
-        assert ohlcv_features.iloc[0]['vwap'] == expected_vwap
-    
-    def test_create_ohlcv_features_price_change(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        assert pd.isna(ohlcv_features.iloc[0]['close_change'])
-        assert pd.isna(ohlcv_features.iloc[0]['close_pct_change'])
-        assert not pd.isna(ohlcv_features.iloc[1]['close_change'])
-    
-    def test_create_ohlcv_features_volume_change(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        expected_vol_change = df.iloc[1]['volume'] - df.iloc[0]['volume']
-        assert ohlcv_features.iloc[1]['volume_change'] == expected_vol_change
-    
-    def test_create_ohlcv_features_true_range(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        simple_range = df.iloc[0]['high'] - df.iloc[0]['low']
-        assert ohlcv_features.iloc[0]['true_range'] == simple_range
-    
-    def test_create_ohlcv_features_gap_detection(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        df = sample_time_series_data.to_dataframe()
-        expected_gap = df.iloc[1]['open'] - df.iloc[0]['close']
-        assert ohlcv_features.iloc[1]['gap'] == expected_gap
-    
-    def test_create_ohlcv_features_wick_calculation(self, sample_time_series_data):
-        fe = FeatureEngineer()
-        ohlcv_features = fe.create_ohlcv_features(sample_time_series_data)
-        
-        assert all(ohlcv_features['upper_wick'] >= 0)
-        assert all(ohlcv_features['lower_wick'] >= 0)
+    def test_create_ohlcv_features_typical_price(self, sample_time_series_data, ohlcv_features):
+        high, low, close = _columns(sample_time_series_data, 'high', 'low', 'close')
+        np.testing.assert_allclose(ohlcv_features['typical_price'].to_numpy(), (high + low + close) / 3)
+    
+    def test_create_ohlcv_features_vwap_calculation(self, sample_time_series_data, ohlcv_features):
+        high, low, close, volume = _columns(sample_time_series_data, 'high', 'low', 'close', 'volume')
+        typical_price = (high + low + close) / 3
+        np.testing.assert_allclose(ohlcv_features['vwap'].to_numpy(), typical_price * volume)
+    
+    def test_create_ohlcv_features_price_change(self, ohlcv_features):
+        close_change = ohlcv_features['close_change'].to_numpy()
+        assert np.isnan(close_change[0])
+        assert np.isnan(ohlcv_features['close_pct_change'].to_numpy()[0])
+        assert not np.isnan(close_change[1:]).any()
+    
+    def test_create_ohlcv_features_volume_change(self, sample_time_series_data, ohlcv_features):
+        volume, = _columns(sample_time_series_data, 'volume')
+        np.testing.assert_allclose(ohlcv_features['volume_change'].to_numpy()[1:], np.diff(volume))
+    
+    def test_create_ohlcv_features_true_range(self, sample_time_series_data, ohlcv_features):
+        high, low, close = _columns(sample_time_series_data, 'high', 'low', 'close')
+        prev_close = close[:-1]
+        expected = np.maximum.reduce([
+            (high - low)[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)
+        ])
+        true_range = ohlcv_features['true_range'].to_numpy()
+        assert true_range[0] == high[0] - low[0]
+        np.testing.assert_allclose(true_range[1:], expected)
+    
+    def test_create_ohlcv_features_gap_detection(self, sample_time_series_data, ohlcv_features):
+        open_, close = _columns(sample_time_series_data, 'open', 'close')
+        np.testing.assert_allclose(ohlcv_features['gap'].to_numpy()[1:], open_[1:] - close[:-1])
+    
+    def test_create_ohlcv_features_wick_calculation(self, ohlcv_features):
+        assert np.all(ohlcv_features['upper_wick'].to_numpy() >= 0)
+        assert np.all(ohlcv_features['lower_wick'].to_numpy() >= 0)
+
+    def test_create_ohlcv_features_nan_rows_match_pandas(self):
+        dates = pd.date_range(start='2025-01-01', periods=6, freq='D')
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': [100, np.nan, 101, 102, 0, 103],
+            'high': [105, 106, np.nan, 107, 108, 109],
+            'low': [95, 96, 97, 98, 99, np.nan],
+            'close': [102, 103, 104, np.nan, 105, 106],
+            'volume': [1000, 1100, 0, 1300, 1400, 1500]
+        })
+        ohlcv_features = FeatureEngineer().create_ohlcv_features(TimeSeriesData.from_dataframe(df))
+
+        prev_close = df['close'].shift(1)
+        price_range = df['high'] - df['low']
+        expected = {
+            'upper_wick': df['high'] - df[['open', 'close']].max(axis=1),
+            'lower_wick': df[['open', 'close']].min(axis=1) - df['low'],
+            'close_position': np.where(price_range > 0, (df['close'] - df['low']) / price_range, 0.5),
+            'volume_pct_change': df['volume'].pct_change() * 100,
+            'volume_price_trend': (df['close'].pct_change() * df['volume']).fillna(0),
+            'true_range': pd.concat([
+                price_range, (df['high'] - prev_close).abs(), (df['low'] - prev_close).abs()
+            ], axis=1).max(axis=1),
+            'body_pct': (df['close'] - df['open']) / df['open'] * 100,
+        }
+        for col, values in expected.items():
+            np.testing.assert_array_equal(ohlcv_features[col].to_numpy(), np.asarray(values, dtype=float))
 
 
 class TestEdgeCases:
@@ -391,8 +496,9 @@ class TestEdgeCases:
         rolling_features = fe.create_rolling_features(ts_data, windows=[3])
         assert not rolling_features.empty
     
-    @pytest.mark.parametrize("lags", [[], [0], [-1], [1, 2, 3]])
-    def test_various_lag_configurations(self, lags):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ten_row_time_series_data(cls):
         dates = pd.date_range(start='2025-01-01', periods=10, freq='D')
         df = pd.DataFrame({
             'timestamp': dates,
@@ -402,13 +508,345 @@ class TestEdgeCases:
             'close': range(5, 15),
             'volume': [1000] * 10
         })
-        ts_data = TimeSeriesData.from_dataframe(df)
+        return _read_only(TimeSeriesData.from_dataframe(df))
+    
+    @pytest.mark.parametrize("lags", [[], [0], [-1], [1, 2, 3]])
+    def test_various_lag_configurations(self, ten_row_time_series_data, lags):
         fe = FeatureEngineer()
         
-        lag_features = fe.create_lag_features(ts_data, lags=lags)
+        lag_features = fe.create_lag_features(ten_row_time_series_data, lags=lags)
         assert len(lag_features.columns) == len(lags)
 
 
+class TestValueDtype:
+    """Test that adapters keep the series' value dtype."""
+    
+    def test_float32_series_stays_float32(self):
+        dates = pd.date_range(start='2025-01-01', periods=50, freq='D')
+        close = np.arange(50, dtype=np.float64) + 100
+        close[3] = np.nan
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000] * 50
+        })
+        ts_data = TimeSeriesData.from_dataframe(df, dtype=np.float32)
+        
+        filled = MissingValueHandler().handle_missing(ts_data, InterpolationMethod.LINEAR)
+        cleaned = StatisticalOutlierDetector().detect_and_remove(filled, OutlierMethod.ZSCORE, 3.0)
+        fe = FeatureEngineer()
+        
+        assert cleaned.close.dtype == np.float32
+        assert (fe.create_lag_features(cleaned, lags=[1, 7]).dtypes == np.float32).all()
+        assert (fe.create_rolling_features(cleaned, windows=[7]).dtypes == np.float32).all()
+
+    
+    def test_astype_downcasts_columns_and_is_noop_for_same_dtype(self):
+        values = np.arange(10, dtype=np.float64)
+        ts_data = TimeSeriesData(
+            timestamps=pd.date_range(start='2025-01-01', periods=10, freq='D'),
+            open=values, high=values, low=values, close=values, volume=values
+        )
+        
+        assert ts_data.astype(np.float64) is ts_data
+        downcast = ts_data.astype(np.float32)
+        assert downcast.dtype == np.float32
+        assert all(getattr(downcast, col).dtype == np.float32
+                   for col in ['open', 'high', 'low', 'close', 'volume'])
+        assert ts_data.close.dtype == np.float64
+
+class TestDataFrameCache:
+    """Test the cached DataFrame view of TimeSeriesData."""
+    
+    @pytest.fixture
+    def ts_data(self):
+        dates = pd.date_range(start='2025-01-01', periods=10, freq='D')
+        values = np.arange(10, dtype=np.float64)
+        return TimeSeriesData(
+            timestamps=dates, open=values, high=values, low=values,
+            close=values.copy(), volume=values
+        )
+    
+    def test_frame_is_built_once(self, ts_data):
+        first = ts_data.to_dataframe()
+        cached = ts_data._df
+        ts_data.to_dataframe()
+        
+        assert ts_data._df is cached
+        assert np.shares_memory(first['close'].to_numpy(), ts_data.close)
+    
+    def test_caller_changes_do_not_leak_into_cache(self, ts_data):
+        df = ts_data.to_dataframe()
+        df['close'] = -1.0
+        df.set_index('timestamp', inplace=True)
+        
+        again = ts_data.to_dataframe()
+        assert 'timestamp' in again.columns
+        np.testing.assert_array_equal(again['close'], np.arange(10))
+    
+    def test_reassigning_a_field_invalidates(self, ts_data):
+        ts_data.to_dataframe()
+        ts_data.close = np.zeros(10)
+        
+        np.testing.assert_array_equal(ts_data.to_dataframe()['close'], np.zeros(10))
+
+
+class TestMissingValueHandler:
+    """Test missing value handling."""
+    
+    @pytest.fixture
+    def gappy_time_series_data(self):
+        dates = pd.date_range(start='2025-01-01', periods=8, freq='D')
+        close = [np.nan, 100, np.nan, np.nan, 106, 107, np.nan, np.nan]
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000, np.nan, 1200, 1300, 1400, 1500, 1600, 1700]
+        })
+        return TimeSeriesData.from_dataframe(df)
+    
+    @pytest.mark.parametrize("method,expected", [
+        (InterpolationMethod.LINEAR, [100, 100, 102, 104, 106, 107, 107, 107]),
+        (InterpolationMethod.FORWARD_FILL, [100, 100, 100, 100, 106, 107, 107, 107]),
+        (InterpolationMethod.BACKWARD_FILL, [100, 100, 106, 106, 106, 107, 107, 107]),
+    ])
+    def test_handle_missing_fills_gaps_and_edges(self, gappy_time_series_data, method, expected):
+        handler = MissingValueHandler()
+        result = handler.handle_missing(gappy_time_series_data, method)
+        
+        np.testing.assert_allclose(result.close, expected)
+        assert not np.isnan(result.volume).any()
+    
+    @pytest.mark.parametrize("method,kwargs", [
+        (InterpolationMethod.SPLINE, {'method': 'spline', 'order': 3}),
+        (InterpolationMethod.POLYNOMIAL, {'method': 'polynomial', 'order': 2}),
+    ])
+    def test_handle_missing_matches_pandas_interpolate(self, method, kwargs):
+        dates = pd.date_range(start='2025-01-01', periods=40, freq='D')
+        close = np.cumsum(_STANDARD_NORMALS[:40]) + 100
+        close[[0, 5, 6, 20, 39]] = np.nan
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000] * 40
+        })
+        handler = MissingValueHandler()
+        result = handler.handle_missing(TimeSeriesData.from_dataframe(df), method)
+        
+        expected = df['close'].interpolate(**kwargs).ffill().bfill()
+        np.testing.assert_allclose(result.close, expected.to_numpy())
+    
+    def test_handle_missing_does_not_mutate_input(self, gappy_time_series_data):
+        handler = MissingValueHandler()
+        handler.handle_missing(gappy_time_series_data, InterpolationMethod.LINEAR)
+        
+        assert np.isnan(gappy_time_series_data.close[0])
+    
+    def test_handle_missing_inplace_matches_copying_variant(self, gappy_time_series_data):
+        handler = MissingValueHandler()
+        expected = handler.handle_missing(gappy_time_series_data, InterpolationMethod.LINEAR)
+        
+        handler.handle_missing_inplace(gappy_time_series_data, InterpolationMethod.LINEAR)
+        
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            np.testing.assert_array_equal(getattr(gappy_time_series_data, col), getattr(expected, col))
+
+
+class TestStatisticalOutlierDetector:
+    """Test statistical outlier detection."""
+    
+    @pytest.fixture
+    def spiky_time_series_data(self):
+        dates = pd.date_range(start='2025-01-01', periods=50, freq='D')
+        close = 100 + _STANDARD_NORMALS
+        close[10] = 150
+        close[30] = 50
+        close[40] = np.nan
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000] * 50
+        })
+        return TimeSeriesData.from_dataframe(df)
+    
+    @pytest.mark.parametrize("method,threshold", [
+        (OutlierMethod.ZSCORE, 3.0),
+        (OutlierMethod.IQR, 3.0),
+    ])
+    def test_detect_only_flags_spikes(self, spiky_time_series_data, method, threshold):
+        detector = StatisticalOutlierDetector()
+        outliers = detector.detect_only(spiky_time_series_data, method, threshold)
+        
+        np.testing.assert_array_equal(outliers, [10, 30])
+    
+    def test_detect_and_remove_matches_pandas_iqr(self, spiky_time_series_data):
+        detector = StatisticalOutlierDetector()
+        result = detector.detect_and_remove(spiky_time_series_data, OutlierMethod.IQR, 1.5)
+        
+        close = spiky_time_series_data.to_dataframe()['close']
+        q1, q3 = close.quantile(0.25), close.quantile(0.75)
+        iqr = q3 - q1
+        expected = close[(close >= q1 - 1.5 * iqr) & (close <= q3 + 1.5 * iqr)]
+        np.testing.assert_array_equal(result.close, expected.to_numpy())
+    
+    def test_detect_and_remove_keeps_features_aligned(self, spiky_time_series_data):
+        spiky_time_series_data.features = [{'row': i} for i in range(50)]
+        detector = StatisticalOutlierDetector()
+        result = detector.detect_and_remove(spiky_time_series_data, OutlierMethod.ZSCORE, 3.0)
+        
+        kept = [f['row'] for f in result.features]
+        assert 10 not in kept and 30 not in kept
+        np.testing.assert_array_equal(result.close, spiky_time_series_data.close[kept])
+        np.testing.assert_array_equal(result.timestamps, spiky_time_series_data.timestamps[kept])
+    
+    def test_detect_and_remove_inplace_matches_copying_variant(self, spiky_time_series_data):
+        detector = StatisticalOutlierDetector()
+        expected = detector.detect_and_remove(spiky_time_series_data, OutlierMethod.ZSCORE, 3.0)
+        
+        detector.detect_and_remove_inplace(spiky_time_series_data, OutlierMethod.ZSCORE, 3.0)
+        
+        pd.testing.assert_index_equal(spiky_time_series_data.timestamps, expected.timestamps)
+        np.testing.assert_array_equal(spiky_time_series_data.close, expected.close)
+
+    def test_zscore_matches_pandas(self, spiky_time_series_data):
+        detector = StatisticalOutlierDetector()
+        result = detector.detect_and_remove(spiky_time_series_data, OutlierMethod.ZSCORE, 2.0)
+
+        close = spiky_time_series_data.to_dataframe()['close']
+        expected = close[((close - close.mean()) / close.std()).abs() < 2.0]
+        np.testing.assert_array_equal(result.close, expected.to_numpy())
+
+    @pytest.mark.parametrize("close", [[100.0] * 5, [np.nan, 100.0, np.nan, np.nan, np.nan]])
+    def test_zscore_undefined_flags_nothing(self, close):
+        dates = pd.date_range(start='2025-01-01', periods=5, freq='D')
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000] * 5
+        })
+        ts_data = TimeSeriesData.from_dataframe(df)
+        detector = StatisticalOutlierDetector()
+        
+        # NaN z-scores (std == 0 or one valid value) are never outliers, and
+        # never inliers either, so removal keeps no rows
+        assert len(detector.detect_only(ts_data, OutlierMethod.ZSCORE, 3.0)) == 0
+        assert len(detector.detect_and_remove(ts_data, OutlierMethod.ZSCORE, 3.0).timestamps) == 0
+
+    def test_inplace_default_forwards_price_column(self, spiky_time_series_data):
+        class PortOnlyDetector(IOutlierDetector):
+            """Implements only the declared port methods"""
+            def __init__(self):
+                self.price_columns = []
+            
+            def detect_and_remove(self, data, method, threshold, price_column='close'):
+                self.price_columns.append(price_column)
+                return StatisticalOutlierDetector().detect_and_remove(data, method, threshold, price_column)
+            
+            def detect_only(self, data, method, threshold, price_column='close'):
+                return StatisticalOutlierDetector().detect_only(data, method, threshold, price_column)
+        
+        detector = PortOnlyDetector()
+        expected = StatisticalOutlierDetector().detect_and_remove(
+            spiky_time_series_data, OutlierMethod.IQR, 1.5, 'open'
+        )
+        detector.detect_and_remove_inplace(spiky_time_series_data, OutlierMethod.IQR, 1.5, 'open')
+        
+        assert detector.price_columns == ['open']
+        np.testing.assert_array_equal(spiky_time_series_data.close, expected.close)
+
+    def test_isolation_forest_is_reused_per_series(self):
+        dates = pd.date_range(start='2025-01-01', periods=50, freq='D')
+        close = 100 + _STANDARD_NORMALS
+        df = pd.DataFrame({
+            'timestamp': dates,
+            'open': close,
+            'high': close,
+            'low': close,
+            'close': close,
+            'volume': [1000] * 50
+        })
+        ts_data = TimeSeriesData.from_dataframe(df, metadata={'series_id': 'AAPL'})
+        detector = StatisticalOutlierDetector()
+        
+        first = detector.detect_only(ts_data, OutlierMethod.ISOLATION_FOREST, 1.0)
+        (key, model), = detector._iforest_cache.items()
+        second = detector.detect_only(ts_data, OutlierMethod.ISOLATION_FOREST, 1.0)
+        
+        np.testing.assert_array_equal(first, second)
+        assert key[:2] == ('AAPL', 'close')
+        assert detector._iforest_cache[key] is model
+        assert len(detector._iforest_cache) == 1
+
+    def test_isolation_forest_refits_when_series_data_changes(self):
+        dates = pd.date_range(start='2025-01-01', periods=200, freq='D')
+        rng = np.random.default_rng(3)
+        detector = StatisticalOutlierDetector()
+        
+        for level in (100, 130):
+            close = level + rng.standard_normal(200)
+            df = pd.DataFrame({
+                'timestamp': dates,
+                'open': close,
+                'high': close,
+                'low': close,
+                'close': close,
+                'volume': [1000] * 200
+            })
+            ts_data = TimeSeriesData.from_dataframe(df, metadata={'series_id': 'AAPL'})
+            kept = detector.detect_and_remove(ts_data, OutlierMethod.ISOLATION_FOREST, 1.0)
+            fresh = StatisticalOutlierDetector().detect_and_remove(ts_data, OutlierMethod.ISOLATION_FOREST, 1.0)
+            
+            np.testing.assert_array_equal(kept.close, fresh.close)
+        
+        assert len(detector._iforest_cache) == 2
+
+
+class TestResampler:
+    """Test OHLCV resampling."""
+    
+    @pytest.fixture
+    def hourly_time_series_data(self):
+        # Shuffled hourly bars with NaN gaps and one empty day
+        dates = pd.date_range(start='2025-01-01', periods=24 * 10, freq='h', tz='UTC')
+        dates = dates[(dates < '2025-01-04') | (dates >= '2025-01-05')]
+        rng = np.random.default_rng(3)
+        n = len(dates)
+        values = {col: rng.uniform(90, 110, n) for col in ['open', 'high', 'low', 'close', 'volume']}
+        for col in values:
+            values[col][rng.choice(n, 20, replace=False)] = np.nan
+        order = rng.permutation(n)
+        df = pd.DataFrame({'timestamp': dates[order], **{col: v[order] for col, v in values.items()}})
+        return TimeSeriesData.from_dataframe(df)
+    
+    @pytest.mark.parametrize("frequency", ['1D', '6h', '1W'])
+    def test_resample_matches_pandas(self, hourly_time_series_data, frequency):
+        result = Resampler().resample(hourly_time_series_data, frequency, AggregationMethod.MEAN)
+        
+        df = hourly_time_series_data.to_dataframe().set_index('timestamp').sort_index()
+        expected = df[['open', 'high', 'low', 'close', 'volume']].resample(frequency).agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'
+        }).dropna()
+        
+        pd.testing.assert_index_equal(result.timestamps, expected.index, check_names=False)
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            np.testing.assert_allclose(getattr(result, col), expected[col].to_numpy(), rtol=1e-12)
+
+
 class TestIndexPreservation:
     """Test that indices are preserved correctly."""
     
@@ -0,0 +1,75 @@
+"""
+Benchmarks for the compiled adapter paths on a 1M-row series.
+
+Regular runs only execute each benchmarked call once (see pytest.ini);
+time them with `pytest tests/test_bench_adapters.py --benchmark-enable --benchmark-only`.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from src.adapters.feature_engineering import FeatureEngineer
+from src.adapters.missing_values import MissingValueHandler
+from src.adapters.outlier_detection import StatisticalOutlierDetector
+from src.domain.models import TimeSeriesData, InterpolationMethod, OutlierMethod
+
+
+@pytest.fixture(scope="module")
+def large_time_series_data():
+    """Minute-bar random walk with 1M rows and ~1% missing closes, shared read-only."""
+    n = 1_000_000
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.standard_normal(n) * 0.1)
+    spread = rng.random(n)
+    close_with_gaps = close.copy()
+    close_with_gaps[rng.integers(0, n, n // 100)] = np.nan
+    df = pd.DataFrame({
+        'timestamp': pd.date_range(start='2020-01-01', periods=n, freq='min'),
+        'open': close + rng.standard_normal(n) * 0.05,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close_with_gaps,
+        'volume': 1000 + 4000 * rng.random(n)
+    }, copy=False)
+    ts_data = TimeSeriesData.from_dataframe(df)
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        ts_data.get_column_array(col).flags.writeable = False
+    return ts_data
+
+
+@pytest.mark.benchmark(group="features")
+def test_bench_ohlcv_features(benchmark, large_time_series_data):
+    features = benchmark(FeatureEngineer().create_ohlcv_features, large_time_series_data)
+    assert len(features) == len(large_time_series_data.timestamps)
+
+
+@pytest.mark.benchmark(group="features")
+def test_bench_rolling_features(benchmark, large_time_series_data):
+    features = benchmark(FeatureEngineer().create_rolling_features, large_time_series_data, [7, 30, 90])
+    assert features.shape == (len(large_time_series_data.timestamps), 12)
+
+
+@pytest.mark.benchmark(group="features")
+def test_bench_lag_features(benchmark, large_time_series_data):
+    features = benchmark(FeatureEngineer().create_lag_features, large_time_series_data, [1, 7, 30])
+    assert features.shape == (len(large_time_series_data.timestamps), 3)
+
+
+@pytest.mark.benchmark(group="features")
+def test_bench_time_features(benchmark, large_time_series_data):
+    features = benchmark(FeatureEngineer().create_time_features, large_time_series_data)
+    assert len(features) == len(large_time_series_data.timestamps)
+
+
+@pytest.mark.benchmark(group="cleaning")
+def test_bench_linear_fill(benchmark, large_time_series_data):
+    filled = benchmark(MissingValueHandler().handle_missing, large_time_series_data, InterpolationMethod.LINEAR)
+    assert not np.isnan(filled.close).any()
+
+
+@pytest.mark.benchmark(group="cleaning")
+def test_bench_zscore_outliers(benchmark, large_time_series_data):
+    cleaned = benchmark(
+        StatisticalOutlierDetector().detect_and_remove,
+        large_time_series_data, OutlierMethod.ZSCORE, 3.0
+    )
+    assert len(cleaned.timestamps) <= len(large_time_series_data.timestamps)
@@ -0,0 +1,135 @@
+"""
+Tests for the Kafka ingestion event handler.
+"""
+import asyncio
+import sys
+import types
+import pytest
+
+# The job tracker lives in a package shared between services; a placeholder
+# lets the handler import, and each test patches in a recording tracker
+sys.modules.setdefault('shared', types.SimpleNamespace(SimpleJobTracker=None))
+
+from src.adapters.input.kafka import message_handler
+from src.adapters.input.kafka.message_handler import IngestionEventHandler
+from src.domain.ports import IEventPublisher
+from tests.test_service import _series, _service, FailingOutlierDetector
+
+
+class RecordingJobTracker:
+    """Collects (job_id, status) pairs in call order"""
+
+    def __init__(self):
+        self.updates = []
+
+    def update_status(self, job_id, series_id, status, stage, **kwargs):
+        self.updates.append((job_id, status))
+
+    def statuses(self, job_id):
+        return [status for updated_job, status in self.updates if updated_job == job_id]
+
+
+class RecordingPublisher(IEventPublisher):
+    """Keeps published completion and failure events"""
+
+    def __init__(self):
+        self.completed = []
+        self.failed = []
+
+    async def publish_preprocessing_completed(self, series_id, job_id, data_points, features_created, metadata):
+        self.completed.append((series_id, job_id))
+
+    async def publish_processing_failed(self, series_id, job_id, error, stage):
+        self.failed.append((series_id, job_id, error))
+
+
+def _event(series_id, job_id, **config):
+    return {
+        'series_id': series_id,
+        'job_id': job_id,
+        'preprocessing_config': {'lag_features': [1], 'rolling_window_sizes': [3], **config}
+    }
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = RecordingJobTracker()
+    monkeypatch.setattr(message_handler, 'SimpleJobTracker', tracker)
+    return tracker
+
+
+class TestHandleBatch:
+    """Test grouping and per-job reporting of consumed events."""
+
+    def _handler(self, raw, outlier_detector=None):
+        service, repository, _ = _service(raw, outlier_detector)
+        publisher = RecordingPublisher()
+        return IngestionEventHandler(service, publisher), repository, publisher
+
+    def test_events_grouped_by_config(self, tracker):
+        handler, repository, publisher = self._handler(
+            {'AAPL': _series('AAPL'), 'MSFT': _series('MSFT'), 'GOOG': _series('GOOG')}
+        )
+
+        asyncio.run(handler.handle_batch([
+            _event('AAPL', 'j1'),
+            _event('GOOG', 'j2', outlier_method='zscore'),
+            _event('MSFT', 'j3'),
+        ]))
+
+        assert repository.many_calls == [['AAPL', 'MSFT'], ['GOOG']]
+        assert publisher.completed == [('AAPL', 'j1'), ('MSFT', 'j3'), ('GOOG', 'j2')]
+        assert publisher.failed == []
+        for job_id in ['j1', 'j2', 'j3']:
+            assert tracker.statuses(job_id) == ['running', 'completed']
+
+    def test_duplicate_series_share_one_run(self, tracker):
+        handler, repository, publisher = self._handler({'AAPL': _series('AAPL')})
+
+        asyncio.run(handler.handle_batch([_event('AAPL', 'j1'), _event('AAPL', 'j2')]))
+
+        assert repository.many_calls == [['AAPL']]
+        assert publisher.completed == [('AAPL', 'j1'), ('AAPL', 'j2')]
+        assert tracker.statuses('j1') == tracker.statuses('j2') == ['running', 'completed']
+
+    def test_bad_events_fail_alone(self, tracker):
+        handler, repository, publisher = self._handler(
+            {'AAPL': _series('AAPL'), 'MSFT': _series('MSFT')}
+        )
+
+        asyncio.run(handler.handle_batch([
+            _event('AAPL', 'j1'),
+            {'series_id': 'MSFT'},
+            _event('MSFT', 'j2', lag_features=[[1]]),
+            _event('MSFT', 'j3', outlier_method='nope'),
+            _event('MSFT', 'j4'),
+        ]))
+
+        assert repository.many_calls == [['AAPL', 'MSFT']]
+        assert publisher.completed == [('AAPL', 'j1'), ('MSFT', 'j4')]
+        assert [(series_id, job_id) for series_id, job_id, _ in publisher.failed] == [
+            ('MSFT', 'j2'), ('MSFT', 'j3')
+        ]
+        assert "unhashable" in publisher.failed[0][2]
+        assert "'nope' is not a valid OutlierMethod" in publisher.failed[1][2]
+        assert tracker.statuses('j2') == tracker.statuses('j3') == ['running', 'failed']
+        assert tracker.statuses('j4') == ['running', 'completed']
+
+    def test_failing_series_reported_per_job(self, tracker):
+        handler, _, publisher = self._handler(
+            {'AAPL': _series('AAPL'), 'BAD': _series('BAD')},
+            outlier_detector=FailingOutlierDetector('BAD')
+        )
+
+        asyncio.run(handler.handle_batch([
+            _event('BAD', 'j1'), _event('AAPL', 'j2'), _event('BAD', 'j3'), _event('NOPE', 'j4')
+        ]))
+
+        assert publisher.completed == [('AAPL', 'j2')]
+        assert publisher.failed == [
+            ('BAD', 'j1', 'detector exploded'),
+            ('BAD', 'j3', 'detector exploded'),
+            ('NOPE', 'j4', 'No raw data found for NOPE'),
+        ]
+        assert tracker.statuses('j1') == tracker.statuses('j3') == ['running', 'failed']
+        assert tracker.statuses('j2') == ['running', 'completed']
@@ -0,0 +1,163 @@
+"""
+Tests for PreprocessingService batch preprocessing.
+"""
+import copy
+import pytest
+import pandas as pd
+import numpy as np
+from src.adapters.feature_engineering import FeatureEngineer
+from src.adapters.missing_values import MissingValueHandler
+from src.adapters.outlier_detection import StatisticalOutlierDetector
+from src.adapters.resampling import Resampler
+from src.domain.models import TimeSeriesData, PreprocessingConfig, OutlierMethod
+from src.domain.ports import ITimeSeriesRepository, ILogger, SeriesNotFoundError
+from src.domain.service import PreprocessingService
+
+
+class InMemoryRepository(ITimeSeriesRepository):
+    """Raw series held in a dict and handed out as copies; saved preprocessed series are recorded"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.saved = {}
+        self.many_calls = []
+
+    def get_raw_data(self, series_id):
+        if series_id not in self.raw:
+            raise SeriesNotFoundError(f"No raw data found for {series_id}")
+        return copy.deepcopy(self.raw[series_id])
+
+    def get_raw_data_many(self, series_ids):
+        self.many_calls.append(list(series_ids))
+        return super().get_raw_data_many(series_ids)
+
+    def save_raw_data(self, series_id, data):
+        return False
+
+    def save_preprocessed_data(self, series_id, data):
+        self.saved[series_id] = data
+        return True
+
+    def get_preprocessed_data(self, series_id):
+        if series_id not in self.saved:
+            raise SeriesNotFoundError(f"No preprocessed data found for {series_id}")
+        return self.saved[series_id]
+
+
+class RecordingLogger(ILogger):
+    """Keeps formatted warnings and errors for assertions"""
+
+    def __init__(self):
+        self.warnings = []
+        self.errors = []
+
+    def info(self, message, *args):
+        pass
+
+    def warning(self, message, *args):
+        self.warnings.append(message % args if args else message)
+
+    def error(self, message, exception=None):
+        self.errors.append((message, exception))
+
+    def debug(self, message, *args):
+        pass
+
+
+def _series(series_id, periods=40):
+    dates = pd.date_range(start='2025-01-01', periods=periods, freq='D')
+    close = 100 + np.sin(np.arange(periods, dtype=np.float64))
+    df = pd.DataFrame({
+        'timestamp': dates,
+        'open': close,
+        'high': close + 1,
+        'low': close - 1,
+        'close': close,
+        'volume': np.full(periods, 1000.0)
+    })
+    return TimeSeriesData.from_dataframe(df, metadata={'series_id': series_id})
+
+
+def _service(raw, outlier_detector=None):
+    repository = InMemoryRepository(raw)
+    logger = RecordingLogger()
+    service = PreprocessingService(
+        repository=repository,
+        missing_handler=MissingValueHandler(),
+        outlier_detector=outlier_detector or StatisticalOutlierDetector(),
+        feature_engineer=FeatureEngineer(),
+        resampler=Resampler(),
+        logger=logger
+    )
+    return service, repository, logger
+
+
+class FailingOutlierDetector(StatisticalOutlierDetector):
+    """Raises for one series, identified by its metadata"""
+
+    def __init__(self, failing_series_id):
+        super().__init__()
+        self.failing_series_id = failing_series_id
+
+    def detect_and_remove_inplace(self, data, method, threshold, price_column='close'):
+        if data.metadata.get('series_id') == self.failing_series_id:
+            raise RuntimeError("detector exploded")
+        super().detect_and_remove_inplace(data, method, threshold, price_column)
+
+
+class TestPreprocessBatch:
+    """Test batch preprocessing through the service."""
+
+    @pytest.fixture
+    def config(self):
+        return PreprocessingConfig(outlier_method=OutlierMethod.IQR, lag_features=[1], rolling_window_sizes=[3])
+
+    def test_results_keyed_by_series_id(self, config):
+        service, repository, _ = _service({'AAPL': _series('AAPL'), 'MSFT': _series('MSFT', 30)})
+
+        batch = service.preprocess_batch(['MSFT', 'AAPL', 'MSFT'], config)
+
+        assert repository.many_calls == [['MSFT', 'AAPL', 'MSFT']]
+        assert set(batch.results) == {'AAPL', 'MSFT'}
+        assert batch.errors == {}
+        assert len(batch.results['MSFT']) == 30
+        assert batch.results['AAPL'].metadata['series_id'] == 'AAPL'
+        assert set(repository.saved) == {'AAPL', 'MSFT'}
+
+    def test_missing_series_warned_and_recorded(self, config):
+        service, _, logger = _service({'AAPL': _series('AAPL')})
+
+        batch = service.preprocess_batch(['AAPL', 'NOPE'], config)
+
+        assert set(batch.results) == {'AAPL'}
+        assert isinstance(batch.errors['NOPE'], SeriesNotFoundError)
+        assert len(logger.warnings) == 1
+        assert "NOPE" in logger.warnings[0]
+
+    def test_failing_series_keeps_other_results(self, config):
+        service, repository, logger = _service(
+            {'AAPL': _series('AAPL'), 'BAD': _series('BAD'), 'MSFT': _series('MSFT')},
+            outlier_detector=FailingOutlierDetector('BAD')
+        )
+
+        batch = service.preprocess_batch(['AAPL', 'BAD', 'MSFT'], config)
+
+        assert set(batch.results) == {'AAPL', 'MSFT'}
+        assert isinstance(batch.errors['BAD'], RuntimeError)
+        assert set(repository.saved) == {'AAPL', 'MSFT'}
+        assert [message for message, _ in logger.errors] == ["Preprocessing failed for BAD"]
+
+    def test_stored_raw_data_left_untouched(self, config):
+        raw = _series('AAPL')
+        close = raw.close.copy()
+        close[5] = np.nan
+        close[10] = 1e6
+        raw.close = close
+        service, _, _ = _service({'AAPL': raw})
+
+        batch = service.preprocess_batch(['AAPL'], config)
+
+        assert len(batch.results['AAPL']) == 39
+        assert len(raw) == 40
+        assert np.isnan(raw.close[5])
+        assert raw.close[10] == 1e6